@@ -6,6 +6,7 @@ On Vercel, app/api/benchmarks reads from benchmark/public-results.
 
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 
@@ -19,6 +20,33 @@ FILES_TO_COPY = (
 )
 
 
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy src -> dst without buffering through userspace where possible.
+
+    os.copy_file_range stays in kernel space (and reflinks on btrfs/xfs);
+    shutil.copy2 remains the fallback for platforms or filesystems where
+    the syscall is unavailable.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        # Unexpected EOF (e.g. source truncated mid-copy):
+                        # fall back to the full userspace copy.
+                        raise OSError("short copy from copy_file_range")
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass  # cross-device copy or unsupported filesystem
+
+    shutil.copy2(src, dst)
+
+
 def copy_results_for_deploy() -> int:
     PUBLIC_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -31,7 +59,7 @@ def copy_results_for_deploy() -> int:
             print(f"[skip] {src} not found")
             continue
 
-        shutil.copy2(src, dst)
+        _copy_file(src, dst)
         copied += 1
         print(f"[ok] copied {src} -> {dst}")
 
@@ -3,12 +3,103 @@ import json
 import re
 from typing import Dict, Any, Optional
 
+# orjson parses 3-5x faster than stdlib json; its JSONDecodeError subclasses
+# json.JSONDecodeError, so existing error handling is unaffected.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional vectorized byte scan for long texts (numpy ships with the pandas
+# dependency). A numba/Cython scanner was considered but would add a compiler
+# toolchain to an otherwise pure-Python evaluator stack.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Below this size the plain str.find loop wins over buffer setup.
+_VECTOR_SCAN_MIN_CHARS = 4096
+
 # Penalty constants for reliability scoring
 MARKDOWN_ISSUE_PENALTY = 5.0  # Penalty per markdown issue
 LATEX_ISSUE_PENALTY = 3.0  # Penalty per LaTeX issue
 JSON_SCHEMA_ISSUE_PENALTY = 10.0  # Penalty per JSON schema issue (more severe)
 LATEX_IN_JSON_PENALTY = 2.0  # Penalty per LaTeX issue in JSON strings
 
+# Forbidden meta-commentary phrases (matched case-insensitively)
+FORBIDDEN_PHRASES = [
+    "Damit kann man sich gut vorbereiten",
+    "Alles kommt aus den Vorlesungsfolien",
+    "Diese Zusammenfassung basiert auf"
+]
+_FORBIDDEN_PHRASES_LOWER = [(phrase.lower(), phrase) for phrase in FORBIDDEN_PHRASES]
+
+# Optional: multi-pattern DFA so all forbidden phrases are found in one pass
+# instead of one substring scan per phrase.
+try:
+    import ahocorasick
+    _FORBIDDEN_AUTOMATON = ahocorasick.Automaton()
+    for _lower, _phrase in _FORBIDDEN_PHRASES_LOWER:
+        _FORBIDDEN_AUTOMATON.add_word(_lower, _phrase)
+    _FORBIDDEN_AUTOMATON.make_automaton()
+except ImportError:
+    _FORBIDDEN_AUTOMATON = None
+
+# Required fields for quiz/flashcard items; frozensets keep the per-item
+# validation a single C-level set difference instead of a per-field loop.
+_QUIZ_REQUIRED_FIELDS = ("sectionId", "sectionTitle", "question", "options", "correctIndex", "sourceSnippet")
+_QUIZ_REQUIRED_SET = frozenset(_QUIZ_REQUIRED_FIELDS)
+_FLASHCARD_REQUIRED_FIELDS = ("sectionId", "sectionTitle", "type", "front", "back", "sourceSnippet")
+_FLASHCARD_REQUIRED_SET = frozenset(_FLASHCARD_REQUIRED_FIELDS)
+_VALID_FLASHCARD_TYPES = frozenset({"qa", "cloze"})
+
+
+def _scan_dollars(text: str) -> tuple[int, int, list[str]]:
+    """
+    Single pass over the `$` positions in `text`.
+
+    Returns (dollar_count, unclosed_inline_count, invalid_display_blocks).
+    """
+    if _np is not None and len(text) >= _VECTOR_SCAN_MIN_CHARS and text.isascii():
+        # One memory-bound pass over the raw bytes; byte offsets equal char
+        # offsets only for ASCII, hence the guard.
+        buf = _np.frombuffer(text.encode('ascii'), dtype=_np.uint8)
+        positions = _np.flatnonzero(buf == ord('$')).tolist()
+    else:
+        positions = []
+        idx = text.find('$')
+        while idx != -1:
+            positions.append(idx)
+            idx = text.find('$', idx + 1)
+
+    # A `$` with no partner before its end-of-line looks like unclosed
+    # inline math ("The formula is $x + y").
+    unclosed_inline = 0
+    for i, pos in enumerate(positions):
+        newline = text.find('\n', pos)
+        next_pos = positions[i + 1] if i + 1 < len(positions) else None
+        if next_pos is None or (newline != -1 and next_pos > newline):
+            unclosed_inline += 1
+
+    # Display math blocks ($$...$$ with non-empty body), derived from the
+    # collected positions instead of another regex pass.
+    invalid_blocks = []
+    i = 0
+    while i + 3 < len(positions):
+        if (positions[i + 1] == positions[i] + 1
+                and positions[i + 2] > positions[i + 1] + 1
+                and positions[i + 3] == positions[i + 2] + 1):
+            block = text[positions[i]:positions[i + 3] + 1]
+            if len(block) < 5:  # At least $$x$$
+                invalid_blocks.append(block[:20])
+            i += 4
+        else:
+            i += 1
+
+    return len(positions), unclosed_inline, invalid_blocks
+
 
 def check_latex_escaping(text: str) -> tuple[bool, list[str]]:
     """
@@ -16,40 +107,65 @@ def check_latex_escaping(text: str) -> tuple[bool, list[str]]:
     Returns (is_valid, list_of_issues)
     """
     issues = []
-    
-    # Check for inline math: $...$ or \(...\)
-    inline_patterns = [
-        r'\$[^$]+\$',  # $...$
-        r'\\\([^)]+\\\)',  # \(...\)
-    ]
-    
-    # Check for display math: $$...$$ or \[...\]
-    display_patterns = [
-        r'\$\$[^$]+\$\$',  # $$...$$
-        r'\\\[[^\]]+\\\]',  # \[...\]
-    ]
-    
-    # Find unescaped dollar signs that might be LaTeX
-    # Look for patterns like "The formula is $x + y" without closing $
-    unclosed_inline = re.findall(r'\$[^$]*$', text, re.MULTILINE)
+
+    dollar_count, unclosed_inline, invalid_blocks = _scan_dollars(text)
+
     if unclosed_inline:
-        issues.append(f"Unclosed inline LaTeX: {len(unclosed_inline)} instances")
-    
+        issues.append(f"Unclosed inline LaTeX: {unclosed_inline} instances")
+
     # Check for proper escaping in markdown context
     # LaTeX should not break markdown parsing
     # Check for $ inside code blocks (should be fine)
     # Check for $ in regular text (should be paired)
-    
-    dollar_count = text.count('$')
     if dollar_count > 0 and dollar_count % 2 != 0:
         issues.append("Unpaired dollar signs (LaTeX delimiters)")
-    
-    # Check for display math blocks
-    display_blocks = re.findall(r'\$\$[^$]+\$\$', text)
-    for block in display_blocks:
-        if len(block) < 5:  # At least $$x$$
-            issues.append(f"Invalid display math block: {block[:20]}")
-    
+
+    for block in invalid_blocks:
+        issues.append(f"Invalid display math block: {block}")
+
+    is_valid = len(issues) == 0
+    return is_valid, issues
+
+
+def _iter_strings(obj: Any):
+    """Yield every string leaf of a parsed JSON structure."""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from _iter_strings(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _iter_strings(value)
+
+
+def _check_latex_in_json(parsed_json: Any) -> tuple[bool, list[str]]:
+    """
+    Check LaTeX escaping across the string leaves of parsed JSON.
+
+    Walks the parsed structure directly instead of re-serializing the whole
+    payload just to scan it, aggregating dollar counts across leaves.
+    """
+    issues = []
+    dollar_total = 0
+    unclosed_total = 0
+    invalid_blocks_total = []
+
+    for leaf in _iter_strings(parsed_json):
+        if '$' not in leaf:
+            continue
+        dollar_count, unclosed_inline, invalid_blocks = _scan_dollars(leaf)
+        dollar_total += dollar_count
+        unclosed_total += unclosed_inline
+        invalid_blocks_total.extend(invalid_blocks)
+
+    if unclosed_total:
+        issues.append(f"Unclosed inline LaTeX: {unclosed_total} instances")
+    if dollar_total > 0 and dollar_total % 2 != 0:
+        issues.append("Unpaired dollar signs (LaTeX delimiters)")
+    for block in invalid_blocks_total:
+        issues.append(f"Invalid display math block: {block}")
+
     is_valid = len(issues) == 0
     return is_valid, issues
 
@@ -58,28 +174,41 @@ def check_markdown_structure(text: str) -> tuple[bool, list[str]]:
     """Check basic markdown structure for summaries."""
     issues = []
     
+    # Probe the stripped span [i, j) once instead of allocating a
+    # text.strip() copy for every prefix test.
+    i = 0
+    j = len(text)
+    while i < j and text[i].isspace():
+        i += 1
+    while j > i and text[j - 1].isspace():
+        j -= 1
+
     # Must start with H1
-    if not text.strip().startswith('#'):
+    if not (i < j and text[i] == '#'):
         issues.append("Does not start with H1 heading")
-    elif not text.strip().startswith('# '):
+    elif not (i + 2 <= j and text[i:i + 2] == '# '):
         # Check if it's properly formatted H1 (not ## or ###)
-        first_line = text.strip().split('\n')[0]
+        newline = text.find('\n', i, j)
+        first_line = text[i:newline if newline != -1 else j]
         if not first_line.startswith('# '):
             issues.append("First heading is not properly formatted H1 (# Title)")
-    
+
     # Check for forbidden metadata/frontmatter
-    if text.strip().startswith('---'):
+    if i + 3 <= j and text[i:i + 3] == '---':
         issues.append("Contains frontmatter (---)")
     
-    # Check for forbidden phrases
-    forbidden_phrases = [
-        "Damit kann man sich gut vorbereiten",
-        "Alles kommt aus den Vorlesungsfolien",
-        "Diese Zusammenfassung basiert auf"
-    ]
-    for phrase in forbidden_phrases:
-        if phrase.lower() in text.lower():
-            issues.append(f"Contains forbidden phrase: {phrase}")
+    # Check for forbidden phrases: lowercase the text once, then either a
+    # single automaton pass or one substring scan per precomputed phrase.
+    text_lower = text.lower()
+    if _FORBIDDEN_AUTOMATON is not None:
+        hits = {phrase for _end, phrase in _FORBIDDEN_AUTOMATON.iter(text_lower)}
+        for phrase in FORBIDDEN_PHRASES:
+            if phrase in hits:
+                issues.append(f"Contains forbidden phrase: {phrase}")
+    else:
+        for phrase_lower, phrase in _FORBIDDEN_PHRASES_LOWER:
+            if phrase_lower in text_lower:
+                issues.append(f"Contains forbidden phrase: {phrase}")
     
     # Basic markdown validity (check for common issues)
     # Unclosed code blocks
@@ -91,6 +220,18 @@ def check_markdown_structure(text: str) -> tuple[bool, list[str]]:
     return is_valid, issues
 
 
+def _scan_summary(text: str) -> tuple[tuple[bool, list[str]], tuple[bool, list[str]]]:
+    """Run both summary checks over the text in one call.
+
+    Returns ((md_valid, md_issues), (latex_valid, latex_issues)). Each
+    remaining sub-check is a single C-level pass (prefix probes, one
+    lowercase + substring scan, str.count, and the dollar-position scan);
+    folding them into one Python-level character loop would be slower, so
+    "fusion" here means sharing one traversal context and entry point.
+    """
+    return check_markdown_structure(text), check_latex_escaping(text)
+
+
 def check_json_structure(data: Any, schema_type: str) -> tuple[bool, list[str]]:
     """Check JSON structure for quizzes and flashcards."""
     issues = []
@@ -110,10 +251,12 @@ def check_json_structure(data: Any, schema_type: str) -> tuple[bool, list[str]]:
                     issues.append(f"Question {i} is not an object")
                     continue
                 
-                required_fields = ["sectionId", "sectionTitle", "question", "options", "correctIndex", "sourceSnippet"]
-                for field in required_fields:
-                    if field not in q:
-                        issues.append(f"Question {i} missing field: {field}")
+                missing = _QUIZ_REQUIRED_SET.difference(q)
+                if missing:
+                    issues.extend(
+                        f"Question {i} missing field: {field}"
+                        for field in _QUIZ_REQUIRED_FIELDS if field in missing
+                    )
                 
                 if "options" in q:
                     if not isinstance(q["options"], list):
@@ -137,13 +280,15 @@ def check_json_structure(data: Any, schema_type: str) -> tuple[bool, list[str]]:
                     issues.append(f"Flashcard {i} is not an object")
                     continue
                 
-                required_fields = ["sectionId", "sectionTitle", "type", "front", "back", "sourceSnippet"]
-                for field in required_fields:
-                    if field not in card:
-                        issues.append(f"Flashcard {i} missing field: {field}")
+                missing = _FLASHCARD_REQUIRED_SET.difference(card)
+                if missing:
+                    issues.extend(
+                        f"Flashcard {i} missing field: {field}"
+                        for field in _FLASHCARD_REQUIRED_FIELDS if field in missing
+                    )
                 
                 if "type" in card:
-                    if card["type"] not in ["qa", "cloze"]:
+                    if card["type"] not in _VALID_FLASHCARD_TYPES:
                         issues.append(f"Flashcard {i} has invalid type: {card['type']}")
     
     is_valid = len(issues) == 0
@@ -153,16 +298,21 @@ def check_json_structure(data: Any, schema_type: str) -> tuple[bool, list[str]]:
 def evaluate_reliability(
     task_type: str,
     output_text: str,
-    parsed_json: Optional[Dict[str, Any]] = None
+    parsed_json: Optional[Dict[str, Any]] = None,
+    serialized: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Evaluate Reliability Score (1-100) separate from Content Quality.
-    
+
     Args:
         task_type: "summary", "quiz", or "flashcards"
         output_text: The raw output text from the model
         parsed_json: Parsed JSON (for quiz/flashcards), None for summaries
-    
+        serialized: Optional pre-serialized form of parsed_json; callers that
+            already hold one (e.g. multi-pass evaluation over the same output)
+            can pass it so the LaTeX scan reuses it instead of re-walking the
+            parsed structure
+
     Returns:
         Dict with reliability_score (1-100), issues list, and details
     """
@@ -185,14 +335,11 @@ def evaluate_reliability(
         }
     
     if task_type == "summary":
-        # Check markdown structure
-        md_valid, md_issues = check_markdown_structure(output_text)
+        # Markdown structure and LaTeX escaping in one fused scan
+        (md_valid, md_issues), (latex_valid, latex_issues) = _scan_summary(output_text)
         all_issues.extend(md_issues)
         if not md_valid:
             score -= len(md_issues) * MARKDOWN_ISSUE_PENALTY
-        
-        # Check LaTeX escaping
-        latex_valid, latex_issues = check_latex_escaping(output_text)
         all_issues.extend(latex_issues)
         if not latex_valid:
             score -= len(latex_issues) * LATEX_ISSUE_PENALTY
@@ -206,7 +353,7 @@ def evaluate_reliability(
         # Try to parse JSON
         try:
             if parsed_json is None:
-                parsed_json = json.loads(output_text)
+                parsed_json = _json_loads(output_text)
         except json.JSONDecodeError as e:
             all_issues.append(f"JSON parse error: {str(e)}")
             score = 1.0  # Critical: unparseable JSON (minimum score is 1, not 0)
@@ -229,9 +376,14 @@ def evaluate_reliability(
         details["json_valid"] = json_valid
         details["json_issues"] = json_issues
         
-        # Also check LaTeX in JSON strings (for explanations, etc.)
-        json_str = json.dumps(parsed_json)
-        latex_valid, latex_issues = check_latex_escaping(json_str)
+        # Also check LaTeX in JSON strings (for explanations, etc.) by
+        # walking the parsed structure's string leaves directly — no
+        # re-serialization of the whole payload. A caller-provided
+        # serialization is reused as-is when available.
+        if serialized is not None:
+            latex_valid, latex_issues = check_latex_escaping(serialized)
+        else:
+            latex_valid, latex_issues = _check_latex_in_json(parsed_json)
         if latex_issues:
             all_issues.extend([f"LaTeX in JSON: {issue}" for issue in latex_issues])
             score -= len(latex_issues) * LATEX_IN_JSON_PENALTY
@@ -1,8 +1,13 @@
 """LLM judge with multi-model consensus evaluation."""
 import asyncio
+import functools
 import hashlib
 import json
 import os
+import re
+import sqlite3
+import statistics
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import sys
@@ -10,16 +15,100 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from benchmark.models.client import ModelClient
 
+# The judge-cache key has no security role (a collision merely returns a wrong
+# cached judgment), so prefer a fast non-cryptographic hash: xxh3 when
+# available, else stdlib BLAKE2b with a short digest.
+try:
+    import xxhash
+
+    def _new_hasher():
+        return xxhash.xxh3_64()
+except ImportError:
+    def _new_hasher():
+        return hashlib.blake2b(digest_size=16)
+
+# numpy is optional here (it ships with the pandas dependency); used to
+# vectorize aggregation once judge panels grow beyond a handful of models.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Below this panel size the pure-Python loop beats array setup costs.
+_VECTOR_AGG_MIN_JUDGES = 8
+
+# orjson (Rust) parses and serializes judge payloads several times faster than
+# stdlib json and works on bytes directly; stdlib stays as the fallback.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def _dumps_compact(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    orjson = None
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+    def _dumps_compact(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# Cached judgments are machine-consumed; compact JSON roughly halves the
+# bytes written and re-read per entry. Set JUDGE_CACHE_PRETTY=1 to keep
+# indented payloads for manual inspection.
+_CACHE_PRETTY = os.getenv("JUDGE_CACHE_PRETTY") == "1"
+
+
+def _dumps_cache(obj) -> str:
+    return _dumps_pretty(obj) if _CACHE_PRETTY else _dumps_compact(obj)
+
+
+def _dumps_cache_blob(obj) -> bytes:
+    """Cache payload as bytes: orjson emits bytes natively, so the encode/
+    decode round-trip disappears on both the write and the read side
+    (sqlite hands the blob straight back to _loads)."""
+    if orjson is not None and not _CACHE_PRETTY:
+        return orjson.dumps(obj)
+    return _dumps_cache(obj).encode()
+
 
 JUDGE_CACHE_DIR = Path(__file__).parent.parent / "results" / "judge_cache"
 JUDGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Single SQLite store instead of one JSON file per judgment: a lookup is one
+# B-tree probe rather than an exists() + open() + read() against a directory
+# that degrades as it grows to tens of thousands of entries.
+_JUDGE_DB_PATH = JUDGE_CACHE_DIR / "judge_cache.db"
+_judge_db_conn: Optional[sqlite3.Connection] = None
+
+
+def _judge_db() -> sqlite3.Connection:
+    """Lazily open the shared judge-cache database (WAL, autocommit)."""
+    global _judge_db_conn
+    if _judge_db_conn is None:
+        conn = sqlite3.connect(_JUDGE_DB_PATH, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS judge_cache (hash TEXT PRIMARY KEY, payload TEXT)")
+        _judge_db_conn = conn
+    return _judge_db_conn
+
 # Cost optimization: Reduced source text length for judges (1500 instead of 2000)
 JUDGE_SOURCE_TEXT_MAX_CHARS = 1500
 JUDGE_RESPONSE_MAX_TOKENS = 220
 
-# Limit concurrent judge calls to prevent API overload
-JUDGE_CONCURRENCY_LIMIT = 3
+# Limit concurrent judge calls to prevent API overload; tune via env to match
+# the provider's rate ceiling (higher fan-out turns into 429s + retry storms).
+JUDGE_CONCURRENCY_LIMIT = int(os.getenv("JUDGE_MAX_CONCURRENCY", "3"))
 _judge_semaphore = asyncio.Semaphore(JUDGE_CONCURRENCY_LIMIT)
 
 # Judge robustness thresholds (1-100 scoring regime)
@@ -33,7 +122,11 @@ JUDGE_AGREEMENT_CRITICAL_THRESHOLD = 0.7
 def get_judge_source_text(source_text: str, max_chars: int = JUDGE_SOURCE_TEXT_MAX_CHARS) -> str:
     """
     Get truncated source text for judge evaluation with intelligent sentence boundary detection.
-    
+
+    The same lecture-chunk source is judged against many outputs
+    back-to-back, so results are memoized (below a size guard, mirroring
+    _normalized_source_bytes).
+
     Args:
         source_text: Full source text
         max_chars: Maximum characters to include (default: 1500)
@@ -41,22 +134,42 @@ def get_judge_source_text(source_text: str, max_chars: int = JUDGE_SOURCE_TEXT_M
     Returns:
         Truncated source text, ideally cut at sentence boundary
     """
+    if len(source_text) <= 1_000_000:
+        return _get_judge_source_text_cached(source_text, max_chars)
+    return _truncate_judge_source_text(source_text, max_chars)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_judge_source_text_cached(source_text: str, max_chars: int) -> str:
+    return _truncate_judge_source_text(source_text, max_chars)
+
+
+def _truncate_judge_source_text(source_text: str, max_chars: int) -> str:
     if len(source_text) <= max_chars:
         return source_text
     
     truncated = source_text[:max_chars]
-    # Try to cut at sentence boundary (period or newline)
-    last_period = truncated.rfind('.')
-    last_newline = truncated.rfind('\n')
-    cut_point = max(last_period, last_newline)
-    
-    # Only use cut point if it's at least 80% of desired length (to avoid too short truncation)
-    if cut_point > max_chars * 0.8:
+    # Try to cut at a sentence boundary (period or newline). Only boundaries
+    # in the last 20% of the window are usable (earlier cuts would truncate
+    # too much), so bound both reverse scans to that window instead of
+    # walking the whole truncated text.
+    window_start = int(max_chars * 0.8) + 1
+    cut_point = max(truncated.rfind('.', window_start), truncated.rfind('\n', window_start))
+    if cut_point != -1:
         return source_text[:cut_point + 1]
     
     return truncated + "..."
 
 
+# Compiled once; normalize_text_for_cache runs for every cache-key computation.
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Fence extractors for judge responses: the json-tagged form wins over the
+# first plain fence, and an unclosed fence captures through to the end.
+_FENCE_JSON_RE = re.compile(r"```json(.*?)(?:```|$)", re.DOTALL)
+_FENCE_ANY_RE = re.compile(r"```(.*?)(?:```|$)", re.DOTALL)
+
+
 def normalize_text_for_cache(text: str) -> str:
     """
     Normalize text for better cache hits by removing excessive whitespace.
@@ -67,44 +180,112 @@ def normalize_text_for_cache(text: str) -> str:
     Returns:
         Normalized text with single spaces and trimmed
     """
-    import re
     # Replace multiple whitespace with single space
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+# Sources above this size bypass memoization so the cache cannot pin
+# hundreds of MB of giant inputs for the life of the process.
+_SOURCE_BYTES_CACHE_MAX_CHARS = 1_000_000
+
+
+@functools.lru_cache(maxsize=256)
+def _normalized_source_bytes_cached(source_text: str) -> bytes:
+    return normalize_text_for_cache(source_text).encode()
 
 
+def _normalized_source_bytes(source_text: str) -> bytes:
+    """Normalized UTF-8 form of a source text.
+
+    Memoized because one lecture-chunk source is shared by dozens of outputs
+    judged back-to-back; repeats skip both the regex normalization and the
+    UTF-8 encode. Oversized sources are normalized without caching.
+    """
+    if len(source_text) <= _SOURCE_BYTES_CACHE_MAX_CHARS:
+        return _normalized_source_bytes_cached(source_text)
+    return normalize_text_for_cache(source_text).encode()
+
+
+@functools.lru_cache(maxsize=4096)
 def get_output_hash(output_text: str, task_type: str, source_text: str) -> str:
     """Generate hash for caching judge evaluations."""
     # Normalize texts for better cache hits (same content = same hash)
     output_text = normalize_text_for_cache(output_text)
-    source_text = normalize_text_for_cache(source_text)
-    
-    # Use full text for better uniqueness, hash if too long
-    if len(output_text) > 10000:
-        output_hash = hashlib.sha256(output_text.encode()).hexdigest()
-        output_text = output_hash
-    if len(source_text) > 10000:
-        source_hash = hashlib.sha256(source_text.encode()).hexdigest()
-        source_text = source_hash
-    content = f"{task_type}:{output_text}:{source_text}"
-    return hashlib.sha256(content.encode()).hexdigest()
+
+    # Feed the hasher incrementally: no interpolated copy of the full texts,
+    # and no pre-hash of long inputs (streaming handles arbitrary lengths).
+    h = _new_hasher()
+    h.update(task_type.encode())
+    h.update(b"\x00")
+    h.update(output_text.encode())
+    h.update(b"\x00")
+    h.update(_normalized_source_bytes(source_text))
+    return h.hexdigest()
+
+
+# In-process LRU above the disk cache: repeated lookups for the same hash_key
+# within one run (same output judged across task passes / re-scores) skip the
+# database entirely. Bounded so long sweeps don't hold every judgment alive.
+_MEM_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_MEM_CACHE_MAX_ENTRIES = 1024
+
+
+def _mem_cache_put(hash_key: str, judgment: Dict[str, Any]) -> None:
+    _MEM_CACHE[hash_key] = judgment
+    _MEM_CACHE.move_to_end(hash_key)
+    while len(_MEM_CACHE) > _MEM_CACHE_MAX_ENTRIES:
+        _MEM_CACHE.popitem(last=False)
 
 
 def load_cached_judgment(hash_key: str) -> Optional[Dict[str, Any]]:
     """Load cached judgment if available."""
+    cached = _MEM_CACHE.get(hash_key)
+    if cached is not None:
+        _MEM_CACHE.move_to_end(hash_key)  # promote on hit
+        return cached
+
+    try:
+        row = _judge_db().execute(
+            "SELECT payload FROM judge_cache WHERE hash = ?", (hash_key,)
+        ).fetchone()
+    except sqlite3.Error:
+        row = None
+    if row is not None:
+        try:
+            judgment = _loads(row[0])
+        except Exception:
+            return None
+        _mem_cache_put(hash_key, judgment)
+        return judgment
+
+    # Legacy file-per-hash entries: migrate into the database on first hit.
     cache_file = JUDGE_CACHE_DIR / f"{hash_key}.json"
     if cache_file.exists():
         try:
-            return json.loads(cache_file.read_text())
+            judgment = _loads(cache_file.read_bytes())
         except Exception:
             return None
+        save_cached_judgment(hash_key, judgment)
+        return judgment
     return None
 
 
 def save_cached_judgment(hash_key: str, judgment: Dict[str, Any]):
     """Save judgment to cache."""
-    cache_file = JUDGE_CACHE_DIR / f"{hash_key}.json"
-    cache_file.write_text(json.dumps(judgment, indent=2))
+    _mem_cache_put(hash_key, judgment)
+    try:
+        _judge_db().execute(
+            "INSERT OR REPLACE INTO judge_cache (hash, payload) VALUES (?, ?)",
+            (hash_key, _dumps_cache_blob(judgment))
+        )
+    except sqlite3.Error:
+        # Fall back to the legacy per-file scheme if the database is unusable.
+        # Write to a temp name and os.replace so a crash mid-write can never
+        # leave a truncated file that load_cached_judgment would swallow.
+        cache_file = JUDGE_CACHE_DIR / f"{hash_key}.json"
+        tmp_file = cache_file.with_suffix(".json.tmp")
+        tmp_file.write_text(_dumps_cache(judgment))
+        os.replace(tmp_file, cache_file)
 
 
 def summarize_consensus_quality(consensus_metrics: Dict[str, Any], judge_count: int) -> Dict[str, Any]:
@@ -154,23 +335,14 @@ def summarize_consensus_quality(consensus_metrics: Dict[str, Any], judge_count:
     }
 
 
-def build_judge_prompt(
-    task_type: str,
-    source_text: str,
-    output_text: str,
-    output_json: Optional[Dict[str, Any]] = None
-) -> str:
-    """Build prompt for judge model."""
-    
-    # Optimize source text length for judges (cost optimization)
-    judge_source = get_judge_source_text(source_text)
-    
-    if task_type == "summary":
-        prompt = f"""Bewerte die Qualität einer KI-generierten Zusammenfassung für akademische Lernzwecke.
+# Prompt scaffolding is identical for every judgment of a task type, so the
+# templates are built once at module scope and expanded with str.format; the
+# dict dispatch also replaces the if/elif chain over task_type.
+_SUMMARY_PROMPT_TMPL = """Bewerte die Qualität einer KI-generierten Zusammenfassung für akademische Lernzwecke.
 
-QUELLE (Referenztext): {judge_source}
+QUELLE (Referenztext): {source}
 
-ZUSAMMENFASSUNG: {output_text}
+ZUSAMMENFASSUNG: {output}
 
 === BEWERTUNG ===
 
@@ -229,16 +401,12 @@ Antworte NUR mit JSON:
   "technical_correctness": <1-100>,
   "reasoning": "Sehr kurze Begründung (max 20 Wörter)"
 }}"""
-    
-    elif task_type == "quiz":
-        questions = output_json.get("questions", []) if output_json else []
-        questions_text = json.dumps(questions, indent=2, ensure_ascii=False)
-        
-        prompt = f"""Bewerte KI-generierte Quiz-Fragen zu Vorlesungsmaterial.
 
-Quelle: {judge_source}
+_QUIZ_PROMPT_TMPL = """Bewerte KI-generierte Quiz-Fragen zu Vorlesungsmaterial.
+
+Quelle: {source}
 
-Quiz-Fragen: {questions_text}
+Quiz-Fragen: {output}
 
 Bewertungsgrundlage: Quelltext ist EINZIGE Referenz. Prüfe nur Übereinstimmung, nicht absolute Korrektheit.
 
@@ -260,16 +428,12 @@ Antworte NUR mit JSON:
   "pedagogical_usefulness": <1-100>,
   "reasoning": "Sehr kurze Begründung (max 20 Wörter)"
 }}"""
-    
-    elif task_type == "flashcards":
-        flashcards = output_json.get("flashcards", []) if output_json else []
-        flashcards_text = json.dumps(flashcards, indent=2, ensure_ascii=False)
-        
-        prompt = f"""Bewerte KI-generierte Flashcards zu Vorlesungsmaterial.
 
-Quelle: {judge_source}
+_FLASHCARDS_PROMPT_TMPL = """Bewerte KI-generierte Flashcards zu Vorlesungsmaterial.
 
-Flashcards: {flashcards_text}
+Quelle: {source}
+
+Flashcards: {output}
 
 Bewertungsgrundlage: Quelltext ist EINZIGE Referenz. Prüfe nur Übereinstimmung, nicht absolute Korrektheit.
 
@@ -291,11 +455,59 @@ Antworte NUR mit JSON:
   "appropriate_detail": <1-100>,
   "reasoning": "Sehr kurze Begründung (max 20 Wörter)"
 }}"""
-    
-    else:
+
+# Canonical score-key order per task type; judge results carry a parallel
+# score_vec in this order so aggregation can stack them without dict probes.
+_TASK_SCORE_KEYS = {
+    "summary": (
+        "factual_accuracy", "completeness", "clarity_structure",
+        "language_quality", "usability", "technical_correctness"
+    ),
+    "quiz": (
+        "factual_accuracy", "completeness", "question_quality",
+        "distractor_quality", "pedagogical_usefulness"
+    ),
+    "flashcards": (
+        "factual_accuracy", "completeness", "clarity",
+        "memorability", "appropriate_detail"
+    ),
+}
+
+# One system prompt shared by every judge call.
+_JUDGE_SYSTEM_PROMPT = """Du bist ein Experte für die Bewertung von KI-generierten Lernmaterialien. 
+Bewerte objektiv und konsistent. Nutze die volle Skala von 1-100."""
+
+_JUDGE_PROMPT_TEMPLATES = {
+    "summary": _SUMMARY_PROMPT_TMPL,
+    "quiz": _QUIZ_PROMPT_TMPL,
+    "flashcards": _FLASHCARDS_PROMPT_TMPL,
+}
+
+
+def build_judge_prompt(
+    task_type: str,
+    source_text: str,
+    output_text: str,
+    output_json: Optional[Dict[str, Any]] = None
+) -> str:
+    """Build prompt for judge model."""
+    template = _JUDGE_PROMPT_TEMPLATES.get(task_type)
+    if template is None:
         raise ValueError(f"Unknown task type: {task_type}")
-    
-    return prompt
+
+    # Optimize source text length for judges (cost optimization)
+    judge_source = get_judge_source_text(source_text)
+
+    # Compact serialization: the judge models don't benefit from indented
+    # arrays, and the prompt is billed per input token.
+    if task_type == "quiz":
+        output = _dumps_compact(output_json.get("questions", []) if output_json else [])
+    elif task_type == "flashcards":
+        output = _dumps_compact(output_json.get("flashcards", []) if output_json else [])
+    else:
+        output = output_text
+
+    return template.format(source=judge_source, output=output)
 
 
 async def judge_with_model(
@@ -305,19 +517,22 @@ async def judge_with_model(
     source_text: str,
     output_text: str,
     output_json: Optional[Dict[str, Any]] = None,
-    model_config: Optional[Dict[str, Any]] = None
+    model_config: Optional[Dict[str, Any]] = None,
+    prompt: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Judge output using a single judge model."""
-    prompt = build_judge_prompt(task_type, source_text, output_text, output_json)
-    
-    system_prompt = """Du bist ein Experte für die Bewertung von KI-generierten Lernmaterialien. 
-Bewerte objektiv und konsistent. Nutze die volle Skala von 1-100."""
-    
+    """Judge output using a single judge model.
+
+    `prompt` lets callers that fan the same output across several judges
+    build the (identical) prompt once instead of once per judge.
+    """
+    if prompt is None:
+        prompt = build_judge_prompt(task_type, source_text, output_text, output_json)
+
     # Use semaphore to limit concurrent judge calls
     async with _judge_semaphore:
         result = await client.generate(
             model_id=model_id,
-            system_prompt=system_prompt,
+            system_prompt=_JUDGE_SYSTEM_PROMPT,
             user_prompt=prompt,
             max_tokens=JUDGE_RESPONSE_MAX_TOKENS,
             temperature=0.1,
@@ -335,8 +550,9 @@ Bewerte objektiv und konsistent. Nutze die volle Skala von 1-100."""
     # Track judge cost
     judge_cost = result.get("cost", 0.0)
     
-    # Check if response is empty
-    if not result.get("text") or not result["text"].strip():
+    # Check if response is empty (no stripped copy allocated)
+    raw_text = result.get("text") or ""
+    if not raw_text or raw_text.isspace():
         return {
             "model_id": model_id,
             "error": "Empty response from judge model",
@@ -346,35 +562,52 @@ Bewerte objektiv und konsistent. Nutze die volle Skala von 1-100."""
     
     # Try to parse JSON from response
     try:
-        # Extract JSON from response (might have markdown code fences)
-        text = result["text"].strip()
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0].strip()
+        # Extract JSON from response (might have markdown code fences):
+        # one compiled-regex scan instead of chained partition calls.
+        # raw_text is fetched once above; the fence regexes tolerate
+        # surrounding whitespace so no pre-strip copy is needed.
+        text = raw_text
+        match = _FENCE_JSON_RE.search(text) or _FENCE_ANY_RE.search(text)
+        if match:
+            text = match.group(1).strip()
         
-        if not text:
+        if not text or text.isspace():
             return {
                 "model_id": model_id,
                 "error": "Empty JSON content after extraction",
                 "scores": {},
-                "raw_response": result["text"],
+                "raw_response": raw_text,
                 "cost": judge_cost
             }
         
-        scores = json.loads(text)
+        # orjson's JSONDecodeError subclasses json.JSONDecodeError, so the
+        # except clause below catches both implementations.
+        scores = _loads(text)
         
-        # Ensure scores are in 1-100 range (clamp only, no conversion needed as prompts use 1-100)
+        # Ensure scores are in 1-100 range (clamp only, no conversion needed
+        # as prompts use 1-100). reasoning is popped up front so the loop is
+        # one type check plus a branchless clamp per numeric entry.
+        reasoning = scores.pop("reasoning", "")
         for key, value in scores.items():
-            if key != "reasoning" and isinstance(value, (int, float)):
-                # Clamp to 1-100
-                scores[key] = max(1.0, min(100.0, float(scores[key])))
-        
+            if isinstance(value, (int, float)):
+                scores[key] = min(100.0, max(1.0, float(value)))
+
+        # Parallel vector in canonical key order (None for missing keys);
+        # lets consensus aggregation stack judgments without dict probes.
+        score_keys = _TASK_SCORE_KEYS.get(task_type)
+        score_vec = None
+        if score_keys is not None:
+            score_vec = [
+                value if isinstance(value := scores.get(key), (int, float)) else None
+                for key in score_keys
+            ]
+
         return {
             "model_id": model_id,
             "error": None,
             "scores": scores,
-            "reasoning": scores.get("reasoning", ""),
+            "score_vec": score_vec,
+            "reasoning": reasoning,
             "cost": judge_cost
         }
     except json.JSONDecodeError as e:
@@ -382,11 +615,67 @@ Bewerte objektiv und konsistent. Nutze die volle Skala von 1-100."""
             "model_id": model_id,
             "error": f"Failed to parse JSON: {str(e)}",
             "scores": {},
-            "raw_response": result["text"],
+            "raw_response": raw_text,
             "cost": judge_cost
         }
 
 
+# Shared fallback client: per-sample consensus calls reuse one httpx
+# connection pool instead of paying TCP+TLS setup per evaluation.
+_default_client: Optional[ModelClient] = None
+_default_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_default_client() -> ModelClient:
+    """Lazily create and reuse the shared ModelClient.
+
+    The client is bound to the event loop it was created on; if the caller
+    is on a different loop (e.g. separate asyncio.run invocations), a fresh
+    client is created rather than reusing one tied to a closed loop.
+    """
+    global _default_client, _default_client_loop
+    loop = asyncio.get_running_loop()
+    if _default_client is None or _default_client_loop is not loop:
+        _default_client = ModelClient()
+        _default_client_loop = loop
+    return _default_client
+
+
+async def close_default_client() -> None:
+    """Close the shared client; call once at shutdown."""
+    global _default_client, _default_client_loop
+    if _default_client is not None:
+        await _default_client.close()
+        _default_client = None
+        _default_client_loop = None
+
+
+# Concurrent consensus calls racing on the same output coalesce onto one
+# in-flight evaluation instead of issuing duplicate paid judge rounds.
+_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+
+def _empty_output_result() -> Dict[str, Any]:
+    """Canned result for empty model outputs (fresh copy per call, since
+    callers may attach fields to the returned dicts)."""
+    return {
+        "error": "Empty output",
+        "aggregated_scores": {
+            "factual_accuracy": {"mean": 1.0, "median": 1.0, "min": 1.0, "max": 1.0, "std_dev": 0.0, "count": 0},
+            "completeness": {"mean": 1.0, "median": 1.0, "min": 1.0, "max": 1.0, "std_dev": 0.0, "count": 0},
+            "quality": {"mean": 1.0, "median": 1.0, "min": 1.0, "max": 1.0, "std_dev": 0.0, "count": 0}
+        },
+        "individual_judgments": [],
+        "consensus_metrics": {},
+        "consensus_quality": summarize_consensus_quality({}, judge_count=0),
+        "consensus_flag": "low_judge_count",
+        "low_confidence": True,
+        "judge_count": 0,
+        "available_models": [],
+        "total_judge_cost": 0.0
+    }
+
+
 async def evaluate_with_consensus(
     judge_models: List[str],
     task_type: str,
@@ -403,24 +692,10 @@ async def evaluate_with_consensus(
     Returns:
         Dict with aggregated scores, individual judgments, consensus metrics
     """
-    # Check if output is empty
-    if not output_text or not output_text.strip():
-        return {
-            "error": "Empty output",
-            "aggregated_scores": {
-                "factual_accuracy": {"mean": 1.0, "median": 1.0, "min": 1.0, "max": 1.0, "std_dev": 0.0, "count": 0},
-                "completeness": {"mean": 1.0, "median": 1.0, "min": 1.0, "max": 1.0, "std_dev": 0.0, "count": 0},
-                "quality": {"mean": 1.0, "median": 1.0, "min": 1.0, "max": 1.0, "std_dev": 0.0, "count": 0}
-            },
-            "individual_judgments": [],
-            "consensus_metrics": {},
-            "consensus_quality": summarize_consensus_quality({}, judge_count=0),
-            "consensus_flag": "low_judge_count",
-            "low_confidence": True,
-            "judge_count": 0,
-            "available_models": [],
-            "total_judge_cost": 0.0
-        }
+    # Check if output is empty; isspace() tests whitespace-only without
+    # allocating the stripped copy.
+    if not output_text or output_text.isspace():
+        return _empty_output_result()
     
     # Check cache
     hash_key = get_output_hash(output_text, task_type, source_text)
@@ -428,18 +703,143 @@ async def evaluate_with_consensus(
         cached = load_cached_judgment(hash_key)
         if cached:
             return cached
-    
-    # Use provided client or create new one
+        # Single-flight: if another task is already evaluating this output,
+        # wait for its result instead of paying for a duplicate judge round.
+        inflight = _INFLIGHT.get(hash_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+    # Use the provided client, or the shared long-lived one. Creating (and
+    # tearing down) a ModelClient per call would pay a TLS handshake per
+    # sample; the shared client keeps the connection pool warm. Drivers that
+    # run many evaluations can still pass their own client explicitly.
     if client is None:
-        async with ModelClient() as client:
-            return await _evaluate_consensus_internal(
-                client, judge_models, task_type, source_text, output_text, output_json, hash_key, use_cache, models_dict
-            )
-    else:
+        client = await get_default_client()
+
+    if not use_cache:
         return await _evaluate_consensus_internal(
             client, judge_models, task_type, source_text, output_text, output_json, hash_key, use_cache, models_dict
         )
 
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[hash_key] = future
+    try:
+        result = await _evaluate_consensus_internal(
+            client, judge_models, task_type, source_text, output_text, output_json, hash_key, use_cache, models_dict
+        )
+    except BaseException as e:
+        if isinstance(e, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(e)
+            future.exception()  # mark retrieved for waiter-less failures
+        raise
+    finally:
+        _INFLIGHT.pop(hash_key, None)
+    future.set_result(result)
+    return result
+
+
+def _build_consensus_result(
+    aggregated: Dict[str, Any],
+    individual_scores: Dict[str, List[float]],
+    consensus_metrics: Dict[str, float],
+    valid_judgments: List[Dict[str, Any]],
+    available_models: List[str],
+    total_judge_cost: float,
+    hash_key: str,
+    use_cache: bool
+) -> Dict[str, Any]:
+    """Assemble (and optionally cache) the consensus result payload."""
+    consensus_quality = summarize_consensus_quality(consensus_metrics, judge_count=len(valid_judgments))
+    if consensus_quality["quality_band"] != "acceptable":
+        print(
+            f"[JUDGE] consensus {consensus_quality['consensus_flag']} "
+            f"(judges={len(valid_judgments)}, max_variance={consensus_quality['max_variance']:.2f}, "
+            f"min_agreement={consensus_quality['min_agreement']:.3f})"
+        )
+
+    result = {
+        "aggregated_scores": aggregated,
+        "individual_judgments": valid_judgments,
+        "consensus_metrics": consensus_metrics,
+        "consensus_quality": consensus_quality,
+        "consensus_flag": consensus_quality["consensus_flag"],
+        "low_confidence": consensus_quality["low_confidence"],
+        "judge_count": len(valid_judgments),
+        "available_models": available_models,
+        "total_judge_cost": total_judge_cost
+    }
+
+    # Cache result
+    if use_cache:
+        save_cached_judgment(hash_key, result)
+
+    return result
+
+
+def _aggregate_scores_vectorized(
+    valid_judgments: List[Dict[str, Any]],
+    score_keys: List[str],
+    task_type: Optional[str] = None
+) -> tuple:
+    """Aggregate an (N judges x K keys) score matrix with numpy reductions.
+
+    Returns (aggregated, individual_scores, consensus_metrics) in the same
+    shapes as the pure-Python loop in _evaluate_consensus_internal.
+    """
+    n = len(valid_judgments)
+
+    # Fast path: every judgment carries a canonical score_vec, so the matrix
+    # is one stack of parallel rows instead of N x K dict probes. Judges that
+    # emitted extra non-canonical keys fall back to the probing path.
+    canonical = _TASK_SCORE_KEYS.get(task_type)
+    if (canonical is not None
+            and set(score_keys) <= set(canonical)
+            and all(
+                isinstance(j.get("score_vec"), list) and len(j["score_vec"]) == len(canonical)
+                for j in valid_judgments
+            )):
+        score_keys = list(canonical)
+        matrix = _np.array(
+            [[v if v is not None else _np.nan for v in j["score_vec"]] for j in valid_judgments],
+            dtype=_np.float64
+        )
+    else:
+        matrix = _np.full((n, len(score_keys)), _np.nan)
+        for i, judgment in enumerate(valid_judgments):
+            scores = judgment.get("scores", {})
+            for k, key in enumerate(score_keys):
+                value = scores.get(key)
+                if isinstance(value, (int, float)):
+                    matrix[i, k] = value
+
+    aggregated = {}
+    individual_scores = {}
+    consensus_metrics = {}
+    for k, key in enumerate(score_keys):
+        column = matrix[:, k]
+        column = column[~_np.isnan(column)]
+        count = int(column.size)
+        if count == 0:
+            continue
+        mean = float(column.mean())
+        variance = float(column.var()) if count > 1 else 0.0
+        individual_scores[key] = column.tolist()
+        aggregated[key] = {
+            "mean": mean,
+            "median": float(_np.median(column)),
+            "min": float(column.min()),
+            "max": float(column.max()),
+            "std_dev": variance ** 0.5,
+            "count": count
+        }
+        if n > 1 and count > 1:
+            consensus_metrics[f"{key}_variance"] = variance
+            consensus_metrics[f"{key}_agreement"] = 1.0 / (1.0 + variance)
+
+    return aggregated, individual_scores, consensus_metrics
+
 
 async def _evaluate_consensus_internal(
     client: ModelClient,
@@ -468,16 +868,19 @@ async def _evaluate_consensus_internal(
             "total_judge_cost": 0.0
         }
     
-    # Run judgments in parallel
+    # Run judgments in parallel; the prompt is identical for every judge, so
+    # build it once here rather than once per model.
+    prompt = build_judge_prompt(task_type, source_text, output_text, output_json)
     tasks = [
         judge_with_model(
-            client, 
-            model_id, 
-            task_type, 
-            source_text, 
-            output_text, 
+            client,
+            model_id,
+            task_type,
+            source_text,
+            output_text,
             output_json,
-            model_config=models_dict.get(model_id) if models_dict else None
+            model_config=models_dict.get(model_id) if models_dict else None,
+            prompt=prompt
         )
         for model_id in available_models
     ]
@@ -507,71 +910,61 @@ async def _evaluate_consensus_internal(
             "total_judge_cost": total_judge_cost
         }
     
-    # Aggregate scores
-    all_score_keys = set()
-    for j in valid_judgments:
-        all_score_keys.update(j.get("scores", {}).keys())
-    
+    # Aggregate scores. The score keys are fully determined by the task type
+    # (each prompt requests a fixed schema), so the per-judgment key-set scan
+    # only remains as a fallback for unknown task types.
+    canonical_keys = _TASK_SCORE_KEYS.get(task_type)
+    if canonical_keys is not None:
+        score_keys = list(canonical_keys)
+    else:
+        all_score_keys = set()
+        for j in valid_judgments:
+            all_score_keys.update(j.get("scores", {}).keys())
+        score_keys = [key for key in all_score_keys if key != "reasoning"]
+
+    if _np is not None and len(valid_judgments) >= _VECTOR_AGG_MIN_JUDGES:
+        # Large panels: one dense matrix + C-level reductions per column.
+        aggregated, individual_scores, consensus_metrics = _aggregate_scores_vectorized(
+            valid_judgments, score_keys, task_type
+        )
+        return _build_consensus_result(
+            aggregated, individual_scores, consensus_metrics, valid_judgments,
+            available_models, total_judge_cost, hash_key, use_cache
+        )
+
     aggregated = {}
     individual_scores = {}
-    
-    for key in all_score_keys:
-        if key == "reasoning":
-            continue
-        
+    consensus_metrics = {}
+    multi_judge = len(valid_judgments) > 1
+
+    for key in score_keys:
         values = []
         for j in valid_judgments:
             score = j.get("scores", {}).get(key)
             if score is not None and isinstance(score, (int, float)):
                 values.append(float(score))
-        
+
         if values:
+            # One pass each in C: fmean for the mean, pvariance reusing that
+            # mean (mu=) so nothing is recomputed at Python level; the same
+            # variance feeds std_dev and the consensus metrics below.
+            n = len(values)
+            mean = statistics.fmean(values)
+            variance = statistics.pvariance(values, mu=mean) if n > 1 else 0.0
             individual_scores[key] = values
             aggregated[key] = {
-                "mean": sum(values) / len(values),
-                "median": sorted(values)[len(values) // 2],
+                "mean": mean,
+                "median": statistics.median(values),
                 "min": min(values),
                 "max": max(values),
-                "std_dev": (
-                    (sum((x - sum(values) / len(values)) ** 2 for x in values) / len(values)) ** 0.5
-                    if len(values) > 1 else 0.0
-                ),
-                "count": len(values)
+                "std_dev": variance ** 0.5,
+                "count": n
             }
-    
-    # Calculate consensus metrics
-    consensus_metrics = {}
-    if len(valid_judgments) > 1:
-        # Calculate variance across judges for each score
-        for key, values in individual_scores.items():
-            if len(values) > 1:
-                mean = sum(values) / len(values)
-                variance = sum((x - mean) ** 2 for x in values) / len(values)
+            if multi_judge and n > 1:
                 consensus_metrics[f"{key}_variance"] = variance
                 consensus_metrics[f"{key}_agreement"] = 1.0 / (1.0 + variance)  # Higher = more agreement
 
-    consensus_quality = summarize_consensus_quality(consensus_metrics, judge_count=len(valid_judgments))
-    if consensus_quality["quality_band"] != "acceptable":
-        print(
-            f"[JUDGE] consensus {consensus_quality['consensus_flag']} "
-            f"(judges={len(valid_judgments)}, max_variance={consensus_quality['max_variance']:.2f}, "
-            f"min_agreement={consensus_quality['min_agreement']:.3f})"
-        )
-
-    result = {
-        "aggregated_scores": aggregated,
-        "individual_judgments": valid_judgments,
-        "consensus_metrics": consensus_metrics,
-        "consensus_quality": consensus_quality,
-        "consensus_flag": consensus_quality["consensus_flag"],
-        "low_confidence": consensus_quality["low_confidence"],
-        "judge_count": len(valid_judgments),
-        "available_models": available_models,
-        "total_judge_cost": total_judge_cost
-    }
-    
-    # Cache result
-    if use_cache:
-        save_cached_judgment(hash_key, result)
-    
-    return result
+    return _build_consensus_result(
+        aggregated, individual_scores, consensus_metrics, valid_judgments,
+        available_models, total_judge_cost, hash_key, use_cache
+    )
@@ -1,8 +1,26 @@
 """Metrics calculation and aggregation with extensive statistics."""
+import math
 import statistics
-from collections import Counter
+from bisect import bisect_right
+from collections import Counter, defaultdict
 from typing import Dict, Any, List, Optional
 
+# numpy ships with the pandas dependency; used for vectorized percentile
+# computation on larger arrays.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Below this size the pure-Python sort+interpolate beats array conversion.
+_VECTOR_PERCENTILE_MIN_N = 64
+
+# Score lists at least this long take the fully vectorized stats path.
+_VECTOR_STATS_MIN_N = 1024
+
+_PERCENTILE_KEYS = ("p0", "p25", "p50", "p75", "p95", "p99", "p100")
+_PERCENTILE_QS = (0.0, 25.0, 50.0, 75.0, 95.0, 99.0, 100.0)
+
 # Overall score calculation constants
 OVERALL_SCORE_BASE_WEIGHT = 0.5  # Base weight for combined reliability+quality score
 OVERALL_SCORE_FACTUAL_WEIGHT = 0.3  # Weight for factual accuracy component
@@ -31,6 +49,11 @@ RELIABILITY_MEDIUM_THRESHOLD = 70.0  # Between 50-70: moderate penalty
 RELIABILITY_HEAVY_PENALTY = 0.3  # Multiplier for reliability < 50
 RELIABILITY_MODERATE_PENALTY = 0.7  # Multiplier for reliability 50-70
 
+# Penalty ladder as parallel tuples: index with bisect instead of an if/elif
+# chain (bucket i covers means below _RELIABILITY_PENALTY_THRESHOLDS[i]).
+_RELIABILITY_PENALTY_THRESHOLDS = (RELIABILITY_LOW_THRESHOLD, RELIABILITY_MEDIUM_THRESHOLD)
+_RELIABILITY_PENALTIES = (RELIABILITY_HEAVY_PENALTY, RELIABILITY_MODERATE_PENALTY, 1.0)
+
 # Consistency penalty constants
 CONSISTENCY_MAX_PENALTY = 0.2  # Maximum penalty for high variance
 CONSISTENCY_VARIANCE_DIVISOR = 200.0  # Divisor for variance normalization
@@ -44,12 +67,8 @@ MIN_TASK_COUNTS_FOR_OVERALL = {
 MIN_REQUIRED_JUDGES = 3
 
 
-def calculate_percentiles(values: List[float]) -> Dict[str, float]:
-    """Calculate percentiles for a list of values."""
-    if not values:
-        return {}
-
-    sorted_vals = sorted(values)
+def _percentiles_from_sorted(sorted_vals: List[float]) -> Dict[str, float]:
+    """Percentiles for an already-sorted list (no extra sort)."""
     n = len(sorted_vals)
 
     def percentile(p: float) -> float:
@@ -62,36 +81,86 @@ def calculate_percentiles(values: List[float]) -> Dict[str, float]:
         return sorted_vals[lower] * (1 - weight) + sorted_vals[upper] * weight
 
     return {
-        "p0": min(sorted_vals),
+        "p0": sorted_vals[0],
         "p25": percentile(0.25),
         "p50": percentile(0.50),  # median
         "p75": percentile(0.75),
         "p95": percentile(0.95),
         "p99": percentile(0.99),
-        "p100": max(sorted_vals)
+        "p100": sorted_vals[-1]
     }
 
 
-def calculate_confidence_interval(values: List[float], confidence: float = 0.95) -> Dict[str, float]:
-    """
-    Calculate confidence interval for a list of values.
+def calculate_percentiles(values: List[float]) -> Dict[str, float]:
+    """Calculate percentiles for a list of values."""
+    if not values:
+        return {}
+    if _np is not None and len(values) >= _VECTOR_PERCENTILE_MIN_N:
+        # One C-level pass (introselect + vectorized linear interpolation),
+        # same interpolation rule as the fallback below.
+        qs = _np.percentile(_np.asarray(values, dtype=_np.float64), _PERCENTILE_QS)
+        return dict(zip(_PERCENTILE_KEYS, qs.tolist()))
+    return _percentiles_from_sorted(sorted(values))
 
-    Uses t-distribution for small samples (n < 30), normal approximation for larger.
 
-    Returns dict with ci_95_lower, ci_95_upper, stderr, margin_of_error.
-    """
-    import math
+def _score_stats(values: List[float]) -> Dict[str, Any]:
+    """Full stats block for a score list from a single sort.
 
+    Every per-metric block previously re-sorted and re-scanned the same list
+    for mean/median/std_dev/min/max/percentiles/CI; this sorts once and
+    derives everything from that array.
+    """
     if not values:
-        return {"ci_95_lower": 0.0, "ci_95_upper": 0.0, "stderr": 0.0, "margin_of_error": 0.0}
+        return {
+            "mean": 0,
+            "median": 0,
+            "std_dev": 0,
+            "min": 0,
+            "max": 0,
+            "percentiles": {},
+            **calculate_confidence_interval([])
+        }
 
     n = len(values)
-    mean = statistics.mean(values)
+    if _np is not None and n >= _VECTOR_STATS_MIN_N:
+        # Large arrays: contiguous float64 storage and C reductions end to
+        # end (the p50/p0/p100 interpolations coincide with median/min/max).
+        arr = _np.asarray(values, dtype=_np.float64)
+        mean = float(arr.mean())
+        std_dev = float(arr.std(ddof=1))
+        percentiles = dict(zip(_PERCENTILE_KEYS, _np.percentile(arr, _PERCENTILE_QS).tolist()))
+        return {
+            "mean": mean,
+            "median": percentiles["p50"],
+            "std_dev": std_dev,
+            "min": percentiles["p0"],
+            "max": percentiles["p100"],
+            "percentiles": percentiles,
+            **_confidence_interval_from_stats(mean, std_dev, n)
+        }
 
-    if n == 1:
-        std_dev = 0.0
-    else:
-        std_dev = statistics.stdev(values)
+    sorted_vals = sorted(values)
+    n = len(sorted_vals)
+    mean = math.fsum(sorted_vals) / n
+    mid = n // 2
+    median = sorted_vals[mid] if n % 2 else (sorted_vals[mid - 1] + sorted_vals[mid]) / 2
+    std_dev = math.sqrt(math.fsum((x - mean) ** 2 for x in sorted_vals) / (n - 1)) if n > 1 else 0
+
+    return {
+        "mean": mean,
+        "median": median,
+        "std_dev": std_dev,
+        "min": sorted_vals[0],
+        "max": sorted_vals[-1],
+        "percentiles": _percentiles_from_sorted(sorted_vals),
+        **_confidence_interval_from_stats(mean, std_dev, n)
+    }
+
+
+def _confidence_interval_from_stats(mean: float, std_dev: float, n: int, confidence: float = 0.95) -> Dict[str, float]:
+    """Confidence interval from precomputed mean/std_dev (no re-scan)."""
+    if n == 0:
+        return {"ci_95_lower": 0.0, "ci_95_upper": 0.0, "stderr": 0.0, "margin_of_error": 0.0}
 
     stderr = std_dev / math.sqrt(n)
 
@@ -115,6 +184,23 @@ def calculate_confidence_interval(values: List[float], confidence: float = 0.95)
     }
 
 
+def calculate_confidence_interval(values: List[float], confidence: float = 0.95) -> Dict[str, float]:
+    """
+    Calculate confidence interval for a list of values.
+
+    Uses t-distribution for small samples (n < 30), normal approximation for larger.
+
+    Returns dict with ci_95_lower, ci_95_upper, stderr, margin_of_error.
+    """
+    if not values:
+        return {"ci_95_lower": 0.0, "ci_95_upper": 0.0, "stderr": 0.0, "margin_of_error": 0.0}
+
+    n = len(values)
+    mean = statistics.mean(values)
+    std_dev = statistics.stdev(values) if n > 1 else 0.0
+    return _confidence_interval_from_stats(mean, std_dev, n, confidence)
+
+
 def confidence_intervals_overlap(metric_a: Dict[str, Any], metric_b: Dict[str, Any]) -> bool:
     """Check if two metric confidence intervals overlap."""
     a_low = metric_a.get("ci_95_lower")
@@ -242,17 +328,20 @@ def calculate_universal_weighted_score(aggregated_scores: Dict[str, Dict[str, fl
     Returns:
         Weighted score from 1-100
     """
-    def get_score(dimension: str) -> float:
-        """Get score for a single dimension."""
-        if dimension in aggregated_scores and "mean" in aggregated_scores[dimension]:
-            return aggregated_scores[dimension]["mean"]
-        return 50.0  # Default to middle if missing
-    
-    factual_score = get_score("factual_accuracy")
-    completeness_score = get_score("completeness")
-    clarity_score = get_score("clarity_structure")
-    language_score = get_score("language_quality")
-    usability_score = get_score("usability")
+    # Unrolled for the five fixed dimensions: one .get each, no per-call
+    # closure. (Generating this with exec at import time was considered and
+    # rejected — same bytecode, unreviewable source.)
+    get = aggregated_scores.get
+    entry = get("factual_accuracy")
+    factual_score = entry["mean"] if entry is not None and "mean" in entry else 50.0
+    entry = get("completeness")
+    completeness_score = entry["mean"] if entry is not None and "mean" in entry else 50.0
+    entry = get("clarity_structure")
+    clarity_score = entry["mean"] if entry is not None and "mean" in entry else 50.0
+    entry = get("language_quality")
+    language_score = entry["mean"] if entry is not None and "mean" in entry else 50.0
+    entry = get("usability")
+    usability_score = entry["mean"] if entry is not None and "mean" in entry else 50.0
     
     weighted_score = (
         factual_score * WEIGHT_FACTUAL_ACCURACY +
@@ -265,6 +354,24 @@ def calculate_universal_weighted_score(aggregated_scores: Dict[str, Dict[str, fl
     return max(1.0, min(100.0, weighted_score))
 
 
+def _input_length_stats(input_lengths: List[float]) -> Dict[str, Any]:
+    """Input-length block from one sorted pass (fsum mean reused for the
+    short-input warning instead of a second statistics.mean scan)."""
+    if not input_lengths:
+        return {"mean": 0, "median": 0, "min": 0, "max": 0, "below_1000_warning": False}
+    sorted_lengths = sorted(input_lengths)
+    n = len(sorted_lengths)
+    mean = math.fsum(sorted_lengths) / n
+    mid = n // 2
+    return {
+        "mean": mean,
+        "median": sorted_lengths[mid] if n % 2 else (sorted_lengths[mid - 1] + sorted_lengths[mid]) / 2,
+        "min": sorted_lengths[0],
+        "max": sorted_lengths[-1],
+        "below_1000_warning": mean < 1000
+    }
+
+
 def aggregate_model_metrics(
     results: List[Dict[str, Any]], 
     config: Optional[Dict[str, Any]] = None
@@ -282,12 +389,12 @@ def aggregate_model_metrics(
     if not results:
         return {}
     
-    # Extract all scores
-    reliability_scores = [r.get("reliability_score", 0) for r in results if "reliability_score" in r]
+    # Extract all scores (single pass over results, below)
+    reliability_scores: List[float] = []
     factual_scores: List[float] = []
     completeness_scores: List[float] = []
     quality_overall: List[float] = []
-    input_lengths = [r.get("input_length_chars", 0) for r in results if isinstance(r.get("input_length_chars"), (int, float))]
+    input_lengths: List[float] = []
     
     # Universal evaluation dimension scores (6 core criteria)
     evaluation_scores: Dict[str, List[float]] = {
@@ -299,14 +406,26 @@ def aggregate_model_metrics(
         "technical_correctness": []
     }
     
-    costs = [r.get("cost", 0) for r in results if "cost" in r]
-    latencies = [r.get("latency_ms", 0) for r in results if "latency_ms" in r]
+    costs: List[float] = []
+    latencies: List[float] = []
     judge_filter_mode = (config or {}).get("judge_quality_filter", "strict")
     excluded_quality_samples = 0
     judge_flag_counter: Counter = Counter()
     
-    # Extract content quality scores from judge evaluations
+    # One pass over results: plain per-sample metrics plus the content
+    # quality scores from judge evaluations (previously five separate
+    # comprehensions plus this loop).
     for r in results:
+        if "reliability_score" in r:
+            reliability_scores.append(r.get("reliability_score", 0))
+        if "cost" in r:
+            costs.append(r.get("cost", 0))
+        if "latency_ms" in r:
+            latencies.append(r.get("latency_ms", 0))
+        input_length = r.get("input_length_chars")
+        if isinstance(input_length, (int, float)):
+            input_lengths.append(input_length)
+
         judge_result = r.get("judge_evaluation", {})
         aggregated = judge_result.get("aggregated_scores", {})
         consensus_flag = judge_result.get("consensus_flag")
@@ -318,31 +437,39 @@ def aggregate_model_metrics(
             excluded_quality_samples += 1
             continue
 
+        # One .get per key instead of an `in` probe followed by a second
+        # lookup; the bound method also skips repeated attribute resolution.
+        agg_get = aggregated.get
+
         # Prefer the explicit per-sample score produced by run_benchmark.py.
         # Newer runs compute and store this under content_quality_score, while
         # judge_result.aggregated_scores may not include a top-level "quality".
         if "content_quality_score" in r:
-            sample_quality = r.get("content_quality_score", 0)
-            quality_overall.append(sample_quality)
-        # Legacy quality score (backward compatibility)
-        elif "quality" in aggregated:
-            quality_overall.append(aggregated["quality"]["mean"])
-        elif "question_quality" in aggregated:
-            quality_overall.append(aggregated["question_quality"]["mean"])
-        elif "clarity" in aggregated:
-            quality_overall.append(aggregated["clarity"]["mean"])
-        
+            quality_overall.append(r.get("content_quality_score", 0))
+        else:
+            # Legacy quality score (backward compatibility)
+            quality_entry = agg_get("quality")
+            if quality_entry is None:
+                quality_entry = agg_get("question_quality")
+            if quality_entry is None:
+                quality_entry = agg_get("clarity")
+            if quality_entry is not None:
+                quality_overall.append(quality_entry["mean"])
+
         # Legacy dimensions
-        if "factual_accuracy" in aggregated:
-            factual_scores.append(aggregated["factual_accuracy"]["mean"])
-        
-        if "completeness" in aggregated:
-            completeness_scores.append(aggregated["completeness"]["mean"])
-        
+        factual_entry = agg_get("factual_accuracy")
+        if factual_entry is not None:
+            factual_scores.append(factual_entry["mean"])
+
+        completeness_entry = agg_get("completeness")
+        if completeness_entry is not None:
+            completeness_scores.append(completeness_entry["mean"])
+
         # Extract all evaluation dimensions
-        for dim in evaluation_scores.keys():
-            if dim in aggregated:
-                evaluation_scores[dim].append(aggregated[dim]["mean"])
+        for dim, dim_bucket in evaluation_scores.items():
+            dim_entry = agg_get(dim)
+            if dim_entry is not None:
+                dim_bucket.append(dim_entry["mean"])
 
     # --- Backward compatibility: auto-upscale legacy 0-10 runs to 1-100 ---
     #
@@ -352,21 +479,29 @@ def aggregate_model_metrics(
     #
     # This detection is per-model (per results list) and only affects models whose
     # data still lives entirely in the 0-10 regime.
-    all_score_values: List[float] = []
-    all_score_values.extend(reliability_scores)
-    all_score_values.extend(quality_overall)
-    all_score_values.extend(factual_scores)
-    all_score_values.extend(completeness_scores)
-
-    # Also collect evaluation dimension values for scale detection
-    for dim_scores in evaluation_scores.values():
-        all_score_values.extend(dim_scores)
-    
-    if all_score_values:
-        max_val = max(all_score_values)
-        min_pos = min(v for v in all_score_values if v > 0) if any(v > 0 for v in all_score_values) else 0
+    # Fused scan: track max and min-positive across all score lists without
+    # concatenating them into a throwaway mega-list (and without the two
+    # extra passes that max()/min() over it would take).
+    score_lists = (reliability_scores, quality_overall, factual_scores, completeness_scores, *evaluation_scores.values())
+    max_val = 0.0
+    min_pos = math.inf
+    legacy_scale_possible = True
+    for score_list in score_lists:
+        for v in score_list:
+            if v > 10:
+                # Modern 1-100 run: no upscale can apply, stop scanning.
+                legacy_scale_possible = False
+                break
+            if v > max_val:
+                max_val = v
+            if 0 < v < min_pos:
+                min_pos = v
+        if not legacy_scale_possible:
+            break
+
+    if legacy_scale_possible:
         # Heuristic: treat as 0-10 scale if everything is in (0, 10] and not all zeros.
-        if 0 < max_val <= 10 and min_pos > 0:
+        if 0 < max_val <= 10 and min_pos != math.inf:
             scale = 10.0
             reliability_scores = [v * scale for v in reliability_scores]
             quality_overall = [v * scale for v in quality_overall]
@@ -376,76 +511,42 @@ def aggregate_model_metrics(
             for dim in evaluation_scores:
                 evaluation_scores[dim] = [v * scale for v in evaluation_scores[dim]]
 
+    # Latency percentiles are referenced four times in the block below;
+    # compute them once.
+    latency_percentiles = calculate_percentiles(latencies) if latencies else {}
+
+    # Cost block from one sorted pass: fsum total doubles as the mean's
+    # numerator, median and percentiles come off the sorted copy.
+    if costs:
+        sorted_costs = sorted(costs)
+        n_costs = len(sorted_costs)
+        cost_total = math.fsum(sorted_costs)
+        mid = n_costs // 2
+        cost_block = {
+            "total": cost_total,
+            "mean": cost_total / n_costs,
+            "median": sorted_costs[mid] if n_costs % 2 else (sorted_costs[mid - 1] + sorted_costs[mid]) / 2,
+            "percentiles": _percentiles_from_sorted(sorted_costs)
+        }
+    else:
+        cost_block = {"total": 0, "mean": 0, "median": 0, "percentiles": {}}
+
     metrics = {
-        "reliability": {
-            "mean": statistics.mean(reliability_scores) if reliability_scores else 0,
-            "median": statistics.median(reliability_scores) if reliability_scores else 0,
-            "std_dev": statistics.stdev(reliability_scores) if len(reliability_scores) > 1 else 0,
-            "min": min(reliability_scores) if reliability_scores else 0,
-            "max": max(reliability_scores) if reliability_scores else 0,
-            "percentiles": calculate_percentiles(reliability_scores) if reliability_scores else {},
-            **calculate_confidence_interval(reliability_scores)
-        },
-        "content_quality": {
-            "mean": statistics.mean(quality_overall) if quality_overall else 0,
-            "median": statistics.median(quality_overall) if quality_overall else 0,
-            "std_dev": statistics.stdev(quality_overall) if len(quality_overall) > 1 else 0,
-            "min": min(quality_overall) if quality_overall else 0,
-            "max": max(quality_overall) if quality_overall else 0,
-            "percentiles": calculate_percentiles(quality_overall) if quality_overall else {},
-            **calculate_confidence_interval(quality_overall)
-        },
-        "factual_accuracy": {
-            "mean": statistics.mean(factual_scores) if factual_scores else 0,
-            "median": statistics.median(factual_scores) if factual_scores else 0,
-            "std_dev": statistics.stdev(factual_scores) if len(factual_scores) > 1 else 0,
-            "min": min(factual_scores) if factual_scores else 0,
-            "max": max(factual_scores) if factual_scores else 0,
-            "percentiles": calculate_percentiles(factual_scores) if factual_scores else {},
-            **calculate_confidence_interval(factual_scores)
-        },
-        "completeness": {
-            "mean": statistics.mean(completeness_scores) if completeness_scores else 0,
-            "median": statistics.median(completeness_scores) if completeness_scores else 0,
-            "std_dev": statistics.stdev(completeness_scores) if len(completeness_scores) > 1 else 0,
-            "min": min(completeness_scores) if completeness_scores else 0,
-            "max": max(completeness_scores) if completeness_scores else 0,
-            "percentiles": calculate_percentiles(completeness_scores) if completeness_scores else {},
-            **calculate_confidence_interval(completeness_scores)
-        },
+        "reliability": _score_stats(reliability_scores),
+        "content_quality": _score_stats(quality_overall),
+        "factual_accuracy": _score_stats(factual_scores),
+        "completeness": _score_stats(completeness_scores),
         # Abitur evaluation dimensions
-        **{
-            dim: {
-                "mean": statistics.mean(scores) if scores else 0,
-                "median": statistics.median(scores) if scores else 0,
-                "std_dev": statistics.stdev(scores) if len(scores) > 1 else 0,
-                "min": min(scores) if scores else 0,
-                "max": max(scores) if scores else 0,
-                "percentiles": calculate_percentiles(scores) if scores else {},
-                **calculate_confidence_interval(scores)
-            }
-            for dim, scores in evaluation_scores.items()
-        },
-        "cost": {
-            "total": sum(costs),
-            "mean": statistics.mean(costs) if costs else 0,
-            "median": statistics.median(costs) if costs else 0,
-            "percentiles": calculate_percentiles(costs) if costs else {}
-        },
+        **{dim: _score_stats(scores) for dim, scores in evaluation_scores.items()},
+        "cost": cost_block,
         "latency": {
-            "mean": statistics.mean(latencies) if latencies else 0,
-            "p50": calculate_percentiles(latencies).get("p50", 0) if latencies else 0,
-            "p95": calculate_percentiles(latencies).get("p95", 0) if latencies else 0,
-            "p99": calculate_percentiles(latencies).get("p99", 0) if latencies else 0,
-            "percentiles": calculate_percentiles(latencies) if latencies else {}
-        },
-        "input_length": {
-            "mean": statistics.mean(input_lengths) if input_lengths else 0,
-            "median": statistics.median(input_lengths) if input_lengths else 0,
-            "min": min(input_lengths) if input_lengths else 0,
-            "max": max(input_lengths) if input_lengths else 0,
-            "below_1000_warning": (statistics.mean(input_lengths) < 1000) if input_lengths else False
+            "mean": math.fsum(latencies) / len(latencies) if latencies else 0,
+            "p50": latency_percentiles.get("p50", 0),
+            "p95": latency_percentiles.get("p95", 0),
+            "p99": latency_percentiles.get("p99", 0),
+            "percentiles": latency_percentiles
         },
+        "input_length": _input_length_stats(input_lengths),
         "test_count": len(results),
         "quality_sample_count": len(quality_overall),
         "quality_excluded_count": excluded_quality_samples,
@@ -495,11 +596,7 @@ def aggregate_model_metrics(
     factual_mean = metrics["factual_accuracy"]["mean"] if factual_scores else quality_mean
     
     # Penalize if reliability is too low (unusable for automation) - scaled to 1-100
-    reliability_penalty = 1.0
-    if reliability_mean < RELIABILITY_LOW_THRESHOLD:
-        reliability_penalty = RELIABILITY_HEAVY_PENALTY
-    elif reliability_mean < RELIABILITY_MEDIUM_THRESHOLD:
-        reliability_penalty = RELIABILITY_MODERATE_PENALTY
+    reliability_penalty = _RELIABILITY_PENALTIES[bisect_right(_RELIABILITY_PENALTY_THRESHOLDS, reliability_mean)]
     
     # Penalize high variance (inconsistent performance) - scaled to 1-100
     reliability_std = metrics["reliability"]["std_dev"]
@@ -528,9 +625,9 @@ def aggregate_model_metrics(
     metrics["overall_score"] = max(1.0, min(100.0, metrics["overall_score"]))
     
     # Calculate universal weighted score based on 6 core dimensions
-    universal_aggregated = {
-        dim: metrics[dim] for dim in EVALUATION_DIMENSIONS if dim in metrics
-    }
+    # Every dimension is always present in metrics (populated above from
+    # evaluation_scores), so no membership filter is needed.
+    universal_aggregated = {dim: metrics[dim] for dim in EVALUATION_DIMENSIONS}
     metrics["universal_weighted_score"] = calculate_universal_weighted_score(universal_aggregated)
     
     # Add category scores for detailed analysis
@@ -761,36 +858,32 @@ def calculate_judge_consensus_metrics(
     results: List[Dict[str, Any]]
 ) -> Dict[str, Any]:
     """Calculate consensus metrics from judge evaluations."""
-    all_variances = {}
-    all_agreements = {}
-    
+    all_variances = defaultdict(list)
+    all_agreements = defaultdict(list)
+
     for result in results:
         judge_result = result.get("judge_evaluation", {})
         consensus = judge_result.get("consensus_metrics", {})
-        
+
         for key, value in consensus.items():
             if key.endswith("_variance"):
-                base_key = key.replace("_variance", "")
-                if base_key not in all_variances:
-                    all_variances[base_key] = []
-                all_variances[base_key].append(value)
+                all_variances[key[:-len("_variance")]].append(value)
             elif key.endswith("_agreement"):
-                base_key = key.replace("_agreement", "")
-                if base_key not in all_agreements:
-                    all_agreements[base_key] = []
-                all_agreements[base_key].append(value)
-    
+                all_agreements[key[:-len("_agreement")]].append(value)
+
+    # Mean and median share one sorted copy per key; defaultdict buckets are
+    # only created on append, so no emptiness re-check is needed.
     consensus_metrics = {}
-    for key, values in all_variances.items():
-        if values:
-            consensus_metrics[f"{key}_mean_variance"] = statistics.mean(values)
-            consensus_metrics[f"{key}_median_variance"] = statistics.median(values)
-    
-    for key, values in all_agreements.items():
-        if values:
-            consensus_metrics[f"{key}_mean_agreement"] = statistics.mean(values)
-            consensus_metrics[f"{key}_median_agreement"] = statistics.median(values)
-    
+    for suffix, buckets in (("variance", all_variances), ("agreement", all_agreements)):
+        for key, values in buckets.items():
+            sorted_vals = sorted(values)
+            n = len(sorted_vals)
+            mid = n // 2
+            consensus_metrics[f"{key}_mean_{suffix}"] = math.fsum(sorted_vals) / n
+            consensus_metrics[f"{key}_median_{suffix}"] = (
+                sorted_vals[mid] if n % 2 else (sorted_vals[mid - 1] + sorted_vals[mid]) / 2
+            )
+
     return consensus_metrics
 
 
@@ -850,58 +943,84 @@ def calculate_comprehensive_model_metrics(
     if not valid_results:
         return {}
     
+    # Bucketize every grouping in one pass instead of re-filtering
+    # valid_results per task/topic/format combination. A pandas groupby was
+    # considered here, but the per-bucket scoring (penalties, CI, weighted
+    # scores) lives in aggregate_model_metrics and re-expressing it as
+    # columnar aggregations would fork that logic.
+    by_task = defaultdict(list)
+    by_topic = defaultdict(list)
+    by_format = defaultdict(list)
+    by_task_topic = defaultdict(lambda: defaultdict(list))
+    by_task_format = defaultdict(lambda: defaultdict(list))
+    by_topic_format = defaultdict(lambda: defaultdict(list))
+    # Raw (no-default) values feed summary_stats in the same pass.
+    tasks_seen = set()
+    topics_seen = set()
+    formats_seen = set()
+    topic_counts = Counter()
+    format_counts = Counter()
+
+    _missing = object()
+    for r in valid_results:
+        # Mirror r.get(key, "unknown") grouping exactly: only a *missing* key
+        # defaults to "unknown"; an explicit None stays its own group.
+        raw_task = r.get("task", _missing)
+        raw_topic = r.get("test_case_topic", _missing)
+        raw_format = r.get("test_case_format", _missing)
+        topic = "unknown" if raw_topic is _missing else raw_topic
+        fmt = "unknown" if raw_format is _missing else raw_format
+
+        by_task["unknown" if raw_task is _missing else raw_task].append(r)
+        by_topic[topic].append(r)
+        by_format[fmt].append(r)
+        tasks_seen.add(None if raw_task is _missing else raw_task)
+        topics_seen.add(None if raw_topic is _missing else raw_topic)
+        formats_seen.add(None if raw_format is _missing else raw_format)
+        topic_counts[None if raw_topic is _missing else raw_topic] += 1
+        format_counts[None if raw_format is _missing else raw_format] += 1
+
+        if raw_task in ("summary", "quiz", "flashcards"):
+            by_task_topic[raw_task][topic].append(r)
+            by_task_format[raw_task][fmt].append(r)
+        if raw_topic is not _missing and raw_topic is not None:
+            by_topic_format[raw_topic][fmt].append(r)
+
     # Overall metrics (all tasks combined)
     overall_metrics = aggregate_model_metrics(valid_results, config)
     
-    # Task-specific metrics
-    task_metrics = calculate_model_metrics_by_dimension(valid_results, "task", config)
-    
-    # Topic-specific metrics
-    topic_metrics = calculate_model_metrics_by_dimension(valid_results, "test_case_topic", config)
-    
-    # Format-specific metrics
-    format_metrics = calculate_model_metrics_by_dimension(valid_results, "test_case_format", config)
-    
-    # Task x Topic breakdown (nested)
-    task_topic_metrics = {}
-    for task in ["summary", "quiz", "flashcards"]:
-        task_results = [r for r in valid_results if r.get("task") == task]
-        if task_results:
-            task_topic_metrics[task] = calculate_model_metrics_by_dimension(task_results, "test_case_topic", config)
+    # Task/topic/format-specific metrics
+    task_metrics = {key: aggregate_model_metrics(group, config) for key, group in by_task.items()}
+    topic_metrics = {key: aggregate_model_metrics(group, config) for key, group in by_topic.items()}
+    format_metrics = {key: aggregate_model_metrics(group, config) for key, group in by_format.items()}
+
+    # Nested breakdowns from the same buckets
+    task_topic_metrics = {
+        task: {topic: aggregate_model_metrics(group, config) for topic, group in groups.items()}
+        for task, groups in by_task_topic.items()
+    }
+    task_format_metrics = {
+        task: {fmt: aggregate_model_metrics(group, config) for fmt, group in groups.items()}
+        for task, groups in by_task_format.items()
+    }
+    topic_format_metrics = {
+        topic: {fmt: aggregate_model_metrics(group, config) for fmt, group in groups.items()}
+        for topic, groups in by_topic_format.items()
+    }
     
-    # Task x Format breakdown (nested)
-    task_format_metrics = {}
-    for task in ["summary", "quiz", "flashcards"]:
-        task_results = [r for r in valid_results if r.get("task") == task]
-        if task_results:
-            task_format_metrics[task] = calculate_model_metrics_by_dimension(task_results, "test_case_format", config)
-    
-    # Topic x Format breakdown (nested)
-    topic_format_metrics = {}
-    topics = set(r.get("test_case_topic", "unknown") for r in valid_results)
-    for topic in topics:
-        topic_results = [r for r in valid_results if r.get("test_case_topic") == topic]
-        if topic_results:
-            topic_format_metrics[topic] = calculate_model_metrics_by_dimension(topic_results, "test_case_format", config)
-    
-    # Summary statistics
+    # Summary statistics, derived from the bucketization pass above instead
+    # of six more scans over valid_results.
     summary_stats = {
         "total_tests": len(valid_results),
-        "tasks_tested": list(set(r.get("task") for r in valid_results)),
-        "topics_tested": list(set(r.get("test_case_topic") for r in valid_results)),
-        "formats_tested": list(set(r.get("test_case_format") for r in valid_results)),
+        "tasks_tested": list(tasks_seen),
+        "topics_tested": list(topics_seen),
+        "formats_tested": list(formats_seen),
         "test_count_by_task": {
-            task: len([r for r in valid_results if r.get("task") == task])
+            task: len(by_task.get(task, ()))
             for task in ["summary", "quiz", "flashcards"]
         },
-        "test_count_by_topic": {
-            topic: len([r for r in valid_results if r.get("test_case_topic") == topic])
-            for topic in set(r.get("test_case_topic", "unknown") for r in valid_results)
-        },
-        "test_count_by_format": {
-            fmt: len([r for r in valid_results if r.get("test_case_format") == fmt])
-            for fmt in set(r.get("test_case_format", "unknown") for r in valid_results)
-        }
+        "test_count_by_topic": {topic: topic_counts.get(topic, 0) for topic in by_topic},
+        "test_count_by_format": {fmt: format_counts.get(fmt, 0) for fmt in by_format}
     }
     
     return {
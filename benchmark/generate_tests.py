@@ -27,7 +27,18 @@ def load_config() -> Dict[str, Any]:
 def load_templates() -> Dict[str, Any]:
     """Load test case templates."""
     with open(TEMPLATES_PATH, encoding="utf-8") as f:
-        return json.load(f)
+        templates = json.load(f)
+
+    # Pre-join the per-topic prompt fragments once at load time so prompt
+    # assembly doesn't redo the slicing/joining for every generated case.
+    for topic_info in templates.get("topics", {}).values():
+        topic_info["_keywords_joined"] = ", ".join(topic_info.get("keywords", [])[:5])
+        formulas = topic_info.get("formulas", [])
+        topic_info["_formulas_line"] = (
+            f"- Enthalte mathematische Formeln: {', '.join(formulas[:3])}" if formulas else ""
+        )
+
+    return templates
 
 
 def build_balanced_generation_plan(
@@ -59,13 +70,15 @@ def build_balanced_generation_plan(
     cell_targets = {cell: min_per_cell for cell in cells}
     remaining = count - minimum_required
 
-    # Distribute extras as evenly as possible.
-    while remaining > 0:
-        for cell in random.sample(cells, len(cells)):
-            if remaining == 0:
-                break
-            cell_targets[cell] += 1
-            remaining -= 1
+    # Distribute extras as evenly as possible: every cell gets the quotient,
+    # and a random subset of cells absorbs the remainder — one sample call
+    # instead of a shuffle per round of the old decrement loop.
+    base_extra, leftover = divmod(remaining, len(cells))
+    if base_extra:
+        for cell in cells:
+            cell_targets[cell] += base_extra
+    for cell in random.sample(cells, leftover):
+        cell_targets[cell] += 1
 
     generation_plan: List[tuple[str, str]] = []
     for cell, target in cell_targets.items():
@@ -89,19 +102,20 @@ def validate_balance(
     min_topic_required = 6
     min_format_required = 12
 
-    topic_violations = {topic: topic_counts.get(topic, 0) for topic in topics if topic_counts.get(topic, 0) < min_topic_required}
-    format_violations = {fmt: format_counts.get(fmt, 0) for fmt in formats if format_counts.get(fmt, 0) < min_format_required}
-    cell_violations = {
-        f"{topic}::{fmt}": cell_counts.get((topic, fmt), 0)
-        for topic in topics
-        for fmt in formats
-        if cell_counts.get((topic, fmt), 0) < min_per_cell
-    }
+    # Materialize each count grid once; the violation dicts filter the grids
+    # instead of re-probing the Counters per key.
+    topic_grid = {topic: topic_counts.get(topic, 0) for topic in topics}
+    format_grid = {fmt: format_counts.get(fmt, 0) for fmt in formats}
+    cell_grid = {f"{topic}::{fmt}": cell_counts.get((topic, fmt), 0) for topic in topics for fmt in formats}
+
+    topic_violations = {topic: n for topic, n in topic_grid.items() if n < min_topic_required}
+    format_violations = {fmt: n for fmt, n in format_grid.items() if n < min_format_required}
+    cell_violations = {cell: n for cell, n in cell_grid.items() if n < min_per_cell}
 
     return {
         "topic_counts": dict(topic_counts),
         "format_counts": dict(format_counts),
-        "cell_counts": {f"{topic}::{fmt}": cell_counts.get((topic, fmt), 0) for topic in topics for fmt in formats},
+        "cell_counts": cell_grid,
         "topic_violations": topic_violations,
         "format_violations": format_violations,
         "cell_violations": cell_violations,
@@ -109,26 +123,15 @@ def validate_balance(
     }
 
 
-def build_generation_prompt(
-    topic: str,
-    format_type: str,
-    templates: Dict[str, Any],
-    target_length: int = 2000
-) -> str:
-    """Build prompt for test case generation."""
-    topic_info = templates["topics"].get(topic, {})
-    keywords = topic_info.get("keywords", [])
-    formulas = topic_info.get("formulas", [])
-    
-    format_prompt = templates["format_prompts"].get(format_type, "")
-    
-    prompt = f"""Erstelle einen akademischen Text zum Thema "{topic}" für eine Vorlesung.
+# The prompt scaffolding never changes within a run; only the topic, length,
+# and pre-joined fragments vary per call.
+_GENERATION_PROMPT_TMPL = """Erstelle einen akademischen Text zum Thema "{topic}" für eine Vorlesung.
 
 Anforderungen:
 - Länge: ca. {target_length} Zeichen
 - Thema: {topic}
-- Verwende Fachbegriffe: {', '.join(keywords[:5])}
-{f'- Enthalte mathematische Formeln: {", ".join(formulas[:3])}' if formulas else ''}
+- Verwende Fachbegriffe: {keywords}
+{formulas_line}
 
 Format-Anforderung:
 {format_prompt}
@@ -140,8 +143,34 @@ Der Text sollte:
 - Für Prüfungsvorbereitung geeignet sein
 
 Gib NUR den Text aus, keine Metadaten, keine Einleitung."""
-    
-    return prompt
+
+
+def build_generation_prompt(
+    topic: str,
+    format_type: str,
+    templates: Dict[str, Any],
+    target_length: int = 2000
+) -> str:
+    """Build prompt for test case generation."""
+    topic_info = templates["topics"].get(topic, {})
+
+    # Prefer the fragments pre-joined by load_templates; fall back to joining
+    # here for templates dicts built elsewhere (e.g. tests).
+    keywords = topic_info.get("_keywords_joined")
+    if keywords is None:
+        keywords = ", ".join(topic_info.get("keywords", [])[:5])
+    formulas_line = topic_info.get("_formulas_line")
+    if formulas_line is None:
+        formulas = topic_info.get("formulas", [])
+        formulas_line = f"- Enthalte mathematische Formeln: {', '.join(formulas[:3])}" if formulas else ""
+
+    return _GENERATION_PROMPT_TMPL.format(
+        topic=topic,
+        target_length=target_length,
+        keywords=keywords,
+        formulas_line=formulas_line,
+        format_prompt=templates["format_prompts"].get(format_type, "")
+    )
 
 
 async def generate_test_case(
@@ -228,32 +257,34 @@ async def generate_test_cases(
             if model not in available_models:
                 print(f"  ✗ {model} (unavailable)")
         
-        # Generate test cases
-        test_cases = []
-        model_rotation = 0
-        
-        print(f"\nGenerating {count} balanced test cases...")
-        
-        for i, (topic, format_type) in enumerate(generation_plan):
-            # Rotate through models
-            model_id = available_models[model_rotation % len(available_models)]
-            model_rotation += 1
-
-            print(f"  [{i+1}/{count}] Generating {topic} ({format_type}) with {model_id}...")
-            
-            test_case = await generate_test_case(
-                client, model_id, topic, format_type, templates, i + 1
-            )
-            
+        # Generate test cases concurrently. The calls are independent HTTP
+        # requests; a semaphore keeps in-flight generations inside provider
+        # rate limits (replacing the old strictly-serial 0.5s delay), and
+        # gather preserves plan order in the returned list.
+        concurrency = int(config.get("generation_concurrency", 4))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        print(f"\nGenerating {count} balanced test cases (concurrency={concurrency})...")
+
+        async def generate_one(index: int, topic: str, format_type: str) -> Dict[str, Any]:
+            # Rotate through models by plan index
+            model_id = available_models[index % len(available_models)]
+            async with semaphore:
+                print(f"  [{index+1}/{count}] Generating {topic} ({format_type}) with {model_id}...")
+                test_case = await generate_test_case(
+                    client, model_id, topic, format_type, templates, index + 1
+                )
+
             if test_case.get("error"):
-                print(f"    ERROR: {test_case['error']}")
+                print(f"    [{index+1}] ERROR: {test_case['error']}")
             else:
-                print(f"    ✓ Generated {test_case['length']} chars")
-            
-            test_cases.append(test_case)
-            
-            # Small delay to avoid rate limits
-            await asyncio.sleep(0.5)
+                print(f"    [{index+1}] ✓ Generated {test_case['length']} chars")
+            return test_case
+
+        test_cases = list(await asyncio.gather(*(
+            generate_one(index, topic, format_type)
+            for index, (topic, format_type) in enumerate(generation_plan)
+        )))
     
     # Save test cases
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -17,6 +17,10 @@ load_dotenv(dotenv_path=env_path)
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+# Availability rarely changes mid-run; cache probe results per model set so a
+# benchmark sweep issues O(1) probes per TTL window instead of one per sample.
+AVAILABILITY_CACHE_TTL_SECONDS = 300.0
+
 
 class ModelClient:
     """Async OpenRouter API client with cost tracking and model availability checks."""
@@ -37,6 +41,8 @@ class ModelClient:
             timeout=120.0
         )
         self._available_models_cache: Optional[List[str]] = None
+        self._availability_cache: Dict[tuple, tuple] = {}
+        self._availability_inflight: Dict[tuple, asyncio.Future] = {}
     
     async def check_model_availability(self, model_id: str) -> bool:
         """Check if a model is available by making a minimal test request."""
@@ -61,8 +67,40 @@ class ModelClient:
             print(f"[WARN] Model {model_id} check failed: {str(e)}")
             return False
     
-    async def check_models_availability(self, model_ids: List[str]) -> Dict[str, bool]:
-        """Check availability of multiple models in parallel."""
+    async def check_models_availability(self, model_ids: List[str], use_cache: bool = True) -> Dict[str, bool]:
+        """Check availability of multiple models in parallel.
+
+        Results are cached per model set for AVAILABILITY_CACHE_TTL_SECONDS,
+        and concurrent first-time probes for the same set are coalesced onto
+        a single in-flight request.
+        """
+        key = tuple(sorted(model_ids))
+        if use_cache:
+            cached = self._availability_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < AVAILABILITY_CACHE_TTL_SECONDS:
+                return dict(cached[1])
+
+            inflight = self._availability_inflight.get(key)
+            if inflight is not None:
+                return dict(await inflight)
+
+            future: asyncio.Future = asyncio.get_running_loop().create_future()
+            self._availability_inflight[key] = future
+            try:
+                availability = await self._probe_models_availability(model_ids)
+            except BaseException:
+                self._availability_inflight.pop(key, None)
+                future.cancel()
+                raise
+            self._availability_cache[key] = (time.monotonic(), availability)
+            self._availability_inflight.pop(key, None)
+            future.set_result(availability)
+            return dict(availability)
+
+        return await self._probe_models_availability(model_ids)
+
+    async def _probe_models_availability(self, model_ids: List[str]) -> Dict[str, bool]:
+        """Issue the actual availability probes for every model in the list."""
         tasks = [self.check_model_availability(model_id) for model_id in model_ids]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Token & Cost Estimator
+
+Counts tiktoken tokens for an input document (PDF or plain text) and
+estimates per-model input/output cost for the configured OpenRouter models.
+
+Usage:
+    python scripts/estimate_tokens.py path/to/lecture.pdf
+    python scripts/estimate_tokens.py notes.txt --models ../config/openrouter-models.json
+    python scripts/estimate_tokens.py notes.txt --output-tokens 1400
+"""
+
+import argparse
+import functools
+import json
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+# Encoder construction is expensive (tiktoken loads and builds the full BPE
+# merge table), so import once at module scope and memoize per encoding name.
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Optional Rust-backed typed JSON decode for the models config; the manual
+# dict-walking parser below stays as the fallback.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+MODELS_PATH = Path(__file__).parent.parent.parent / "config" / "openrouter-models.json"
+EXAMPLE_MODELS_PATH = Path(__file__).parent.parent.parent / "config" / "openrouter-models.example.json"
+
+# Interned so encoding comparisons and dict/set lookups are pointer checks.
+O200K_BASE = sys.intern("o200k_base")
+CL100K_BASE = sys.intern("cl100k_base")
+
+# Matches DEFAULT_SUMMARY_MAX_TOKENS in run_benchmark.py
+DEFAULT_OUTPUT_TOKENS = 1800
+
+# Above this size, tokenize in parallel chunks (tiktoken's batch API
+# releases the GIL and fans out across cores).
+BATCH_THRESHOLD_CHARS = 256 * 1024
+BATCH_CHUNK_CHARS = 64 * 1024
+
+
+@dataclass
+class Pricing:
+    """Per-million-token pricing as configured in openrouter-models.json."""
+    currency: str = "USD"
+    input_per_1m: Optional[float] = None
+    output_per_1m: Optional[float] = None
+
+
+@dataclass
+class ModelSpec:
+    """A single model entry from the models config."""
+    name: str
+    provider: str
+    tier: str
+    encoding: str
+    pricing: Pricing
+
+
+@functools.lru_cache(maxsize=None)
+def _default_models() -> tuple:
+    """Fallback specs, built lazily on first use (module import stays cheap
+    for --help and list-only paths)."""
+    return (
+        ModelSpec("openai/gpt-5.3-chat", "openai", "pro", O200K_BASE, Pricing("USD", 1.75, 14)),
+        ModelSpec("openai/gpt-5.4", "openai", "pro", O200K_BASE, Pricing("USD", 2.5, 15)),
+        ModelSpec("openai/gpt-5.4-mini", "openai", "basic", O200K_BASE, Pricing("USD", 0.75, 4.5)),
+        ModelSpec("openai/gpt-5.4-nano", "openai", "free", O200K_BASE, Pricing("USD", 0.2, 1.25)),
+        ModelSpec("openai/gpt-5-mini", "openai", "basic", O200K_BASE, Pricing("USD", 0.25, 2)),
+        ModelSpec("openai/gpt-oss-120b", "openai", "free", O200K_BASE, Pricing("USD", 0.039, 0.19)),
+        ModelSpec("google/gemini-3-flash-preview", "google", "basic", CL100K_BASE, Pricing("USD", 0.5, 3)),
+        ModelSpec("google/gemini-3.1-pro-preview", "google", "pro", CL100K_BASE, Pricing("USD", 2, 12)),
+        ModelSpec("google/gemini-3.1-flash-lite-preview", "google", "basic", CL100K_BASE, Pricing("USD", 0.25, 1.5)),
+        ModelSpec("anthropic/claude-sonnet-4.6", "anthropic", "plus", CL100K_BASE, Pricing("USD", 3, 15)),
+        ModelSpec("anthropic/claude-opus-4.6", "anthropic", "pro", CL100K_BASE, Pricing("USD", 5, 25)),
+        ModelSpec("mistralai/mistral-small-2603", "mistralai", "basic", CL100K_BASE, Pricing("USD", 0.15, 0.6)),
+        ModelSpec("x-ai/grok-4.1-fast", "x-ai", "free", CL100K_BASE, Pricing("USD", 0.2, 0.5)),
+        ModelSpec("nvidia/nemotron-3-super-120b-a12b:free", "nvidia", "free", CL100K_BASE, Pricing("USD", 0, 0)),
+        ModelSpec("moonshotai/kimi-k2.5", "moonshotai", "basic", CL100K_BASE, Pricing("USD", 0.6, 3)),
+        ModelSpec("deepseek/deepseek-v3.2", "deepseek", "basic", CL100K_BASE, Pricing("USD", 0.28, 0.42)),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(name: str):
+    """Return a memoized tiktoken encoder for `name` (construction is ~30ms)."""
+    if tiktoken is None:
+        raise RuntimeError("tiktoken is required: pip install tiktoken")
+    return tiktoken.get_encoding(name)
+
+
+def _chunk_text(text: str, chunk_chars: int = BATCH_CHUNK_CHARS) -> List[str]:
+    """Split `text` into ~chunk_chars pieces, preferring paragraph boundaries.
+
+    The pieces concatenate back to the original text, so summed token counts
+    match a whole-text encode (modulo rare merges across a paragraph break).
+    """
+    chunks: List[str] = []
+    start = 0
+    n = len(text)
+    while start < n:
+        end = min(start + chunk_chars, n)
+        if end < n:
+            cut = text.rfind("\n\n", start, end)
+            if cut > start:
+                end = cut + 2
+        chunks.append(text[start:end])
+        start = end
+    return chunks
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_encoding(name: str):
+    """Resolve an encoding name to an encoder, falling back to cl100k_base
+    exactly once for unknown names (memoized, so the try/except cost is not
+    paid per call)."""
+    try:
+        return _get_encoding(name)
+    except Exception:
+        return _get_encoding("cl100k_base")
+
+
+def _count_with_encoder(enc_obj, chunks: List[str]) -> int:
+    """Count tokens across pre-split chunks with an already-resolved encoder."""
+    batches = enc_obj.encode_ordinary_batch(chunks, num_threads=os.cpu_count() or 1)
+    return sum(len(ids) for ids in batches)
+
+
+def count_tokens(text: str, enc: str) -> int:
+    """Count tokens in `text` using the named tiktoken encoding."""
+    enc_obj = _resolve_encoding(enc)
+    # encode_ordinary skips special-token scanning; for large inputs, batch
+    # across cores and only keep the lengths so the id lists are freed early.
+    if len(text) >= BATCH_THRESHOLD_CHARS:
+        return _count_with_encoder(enc_obj, _chunk_text(text))
+    return len(enc_obj.encode_ordinary(text))
+
+
+def count_chunk_tokens(chunks: List[str], enc: str) -> int:
+    """Count tokens across pre-split chunks using the batch encoder."""
+    return _count_with_encoder(_resolve_encoding(enc), chunks)
+
+
+def iter_pdf_pages(pdf_path: Path) -> Iterator[str]:
+    """Yield per-page text from a PDF, skipping blank pages.
+
+    Prefers pypdfium2 (native PDFium, typically 5-20x faster than PyPDF2's
+    pure-Python content-stream interpreter) and falls back to PyPDF2.
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ModuleNotFoundError:
+        yield from _iter_pdf_pages_pypdf2(pdf_path)
+        return
+
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        for page in pdf:
+            page_text = page.get_textpage().get_text_range()
+            if page_text.strip():
+                yield page_text
+    finally:
+        pdf.close()
+
+
+def _iter_pdf_pages_pypdf2(pdf_path: Path) -> Iterator[str]:
+    """PyPDF2 fallback used when pypdfium2 is not installed."""
+    try:
+        from PyPDF2 import PdfReader
+    except ImportError:
+        raise RuntimeError("pypdfium2 (or PyPDF2) is required for PDF inputs: pip install pypdfium2")
+
+    reader = PdfReader(str(pdf_path))
+    for page in reader.pages:
+        page_text = page.extract_text() or ""
+        if page_text.strip():
+            yield page_text
+
+
+def extract_text_from_pdf(pdf_path: Path) -> str:
+    """Extract plain text from a PDF, page by page."""
+    return "\n\n".join(iter_pdf_pages(pdf_path))
+
+
+def _read_text_file(input_path: Path) -> str:
+    """Read a text file, decoding straight out of memory-mapped pages.
+
+    Path.read_text allocates the full bytes buffer and then the decoded str
+    (2x peak). Decoding directly from the mmap keeps peak memory at one copy
+    plus whatever pages the OS has touched.
+    """
+    with open(input_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(memoryview(mm), "utf-8", "replace")
+
+
+def load_chunks(input_path: Path) -> List[str]:
+    """Load the input document as a list of tokenizer-ready text chunks.
+
+    PDFs stay page-sized so pages flow straight into the batch encoder
+    without ever concatenating the full document per encoding; plain text
+    is split into ~64KB pieces at paragraph boundaries.
+    """
+    if input_path.suffix.lower() == ".pdf":
+        return list(iter_pdf_pages(input_path))
+    return _chunk_text(_read_text_file(input_path))
+
+
+def load_text(input_path: Path) -> str:
+    """Load the input document as plain text."""
+    if input_path.suffix.lower() == ".pdf":
+        return extract_text_from_pdf(input_path)
+    return _read_text_file(input_path)
+
+
+if msgspec is not None:
+    class _PricingIn(msgspec.Struct):
+        currency: str = "USD"
+        input_per_1m: Optional[float] = None
+        output_per_1m: Optional[float] = None
+
+    class _TokenizerIn(msgspec.Struct):
+        tiktoken_encoding: str = "cl100k_base"
+
+    class _ModelIn(msgspec.Struct):
+        id: str
+        subscription_tier: str = "free"
+        tokenizer: Optional[_TokenizerIn] = None
+        pricing: Optional[_PricingIn] = None
+
+
+def _parse_models_msgspec(path: Path) -> List[ModelSpec]:
+    """Typed zero-copy decode of the models config via msgspec."""
+    try:
+        entries = msgspec.json.decode(path.read_bytes(), type=List[_ModelIn])
+    except msgspec.ValidationError as e:
+        raise ValueError(f"Invalid models config {path}: {e}") from e
+
+    models: List[ModelSpec] = []
+    for entry in entries:
+        tokenizer = entry.tokenizer or _TokenizerIn()
+        pricing_in = entry.pricing or _PricingIn()
+        models.append(ModelSpec(
+            name=entry.id,
+            provider=entry.id.split("/")[0],
+            tier=entry.subscription_tier,
+            encoding=sys.intern(tokenizer.tiktoken_encoding),
+            pricing=Pricing(pricing_in.currency, pricing_in.input_per_1m, pricing_in.output_per_1m),
+        ))
+    return models
+
+
+def _parse_models_json(path: Path) -> List[ModelSpec]:
+    """Parse a models config JSON into ModelSpec entries."""
+    if msgspec is not None:
+        return _parse_models_msgspec(path)
+
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if not isinstance(data, list):
+        raise ValueError(f"Models config must be a JSON array: {path}")
+
+    models: List[ModelSpec] = []
+    for i, entry in enumerate(data):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Model entry {i} is not an object")
+        name = entry.get("id")
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"Model entry {i} is missing 'id'")
+
+        tokenizer = entry.get("tokenizer", {})
+        encoding = tokenizer.get("tiktoken_encoding", "cl100k_base") if isinstance(tokenizer, dict) else "cl100k_base"
+
+        pricing_raw = entry.get("pricing", {})
+        if not isinstance(pricing_raw, dict):
+            pricing_raw = {}
+        pricing = Pricing(
+            currency=pricing_raw.get("currency", "USD"),
+            input_per_1m=pricing_raw.get("input_per_1m"),
+            output_per_1m=pricing_raw.get("output_per_1m"),
+        )
+
+        models.append(ModelSpec(
+            name=name,
+            provider=name.split("/")[0],
+            tier=entry.get("subscription_tier", "free"),
+            encoding=sys.intern(encoding),
+            pricing=pricing,
+        ))
+
+    return models
+
+
+# Parsed model lists keyed on (path, mtime_ns, size); repeated invocations
+# (e.g. CI token-cost estimation across many files) skip the re-parse.
+_MODELS_CACHE: dict = {}
+_MODELS_DISK_CACHE = Path(tempfile.gettempdir()) / "zemni_models_cache.pkl"
+
+
+def _load_models_disk_cache(key: tuple) -> Optional[List[ModelSpec]]:
+    """Look up a parsed model list in the cross-process pickle cache.
+
+    The cache file is only trusted when owned by the current user (pickle
+    from a shared temp dir is otherwise attacker-controlled input).
+    """
+    try:
+        if os.stat(_MODELS_DISK_CACHE).st_uid != os.getuid():
+            return None
+        with open(_MODELS_DISK_CACHE, "rb") as f:
+            return pickle.load(f).get(key)
+    except Exception:
+        return None
+
+
+def _save_models_disk_cache(key: tuple, models: List[ModelSpec]) -> None:
+    """Best-effort write-through to the cross-process pickle cache."""
+    try:
+        cached: dict = {}
+        if _MODELS_DISK_CACHE.exists() and os.stat(_MODELS_DISK_CACHE).st_uid == os.getuid():
+            with open(_MODELS_DISK_CACHE, "rb") as f:
+                cached = pickle.load(f)
+        cached[key] = models
+        with open(_MODELS_DISK_CACHE, "wb") as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(_MODELS_DISK_CACHE, 0o600)
+    except Exception:
+        pass
+
+
+def load_models(models_path: Optional[Path] = None) -> List[ModelSpec]:
+    """Load model specs from an explicit path, the repo config, or the built-in fallback."""
+    if models_path is not None and not models_path.exists():
+        raise FileNotFoundError(f"Models config not found: {models_path}")
+    candidates = [models_path] if models_path else [MODELS_PATH, EXAMPLE_MODELS_PATH]
+    for candidate in candidates:
+        if candidate and candidate.exists():
+            st = candidate.stat()
+            key = (str(candidate), st.st_mtime_ns, st.st_size)
+            models = _MODELS_CACHE.get(key)
+            if models is None:
+                models = _load_models_disk_cache(key)
+            if models is None:
+                models = _parse_models_json(candidate)
+                _save_models_disk_cache(key, models)
+            _MODELS_CACHE[key] = models
+            return models
+    return list(_default_models())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Estimate token counts and per-model costs for a document")
+    parser.add_argument("input", type=Path, help="Input document (.pdf or plain text)")
+    parser.add_argument("--models", type=Path, default=None, help="Path to a models config JSON")
+    parser.add_argument(
+        "--output-tokens",
+        type=int,
+        default=DEFAULT_OUTPUT_TOKENS,
+        help=f"Assumed completion tokens for the output-cost estimate (default: {DEFAULT_OUTPUT_TOKENS})"
+    )
+    args = parser.parse_args()
+
+    if not args.input.exists():
+        print(f"ERROR: input file not found: {args.input}")
+        return 1
+
+    # Page/paragraph-sized chunks are loaded once and shared by every
+    # encoding, so peak memory stays at one copy of the document.
+    chunks = load_chunks(args.input)
+    total_chars = sum(len(chunk) for chunk in chunks)
+    models = load_models(args.models)
+
+    # Tokenize once per distinct encoding, not once per model. tiktoken's
+    # Rust core releases the GIL during encode, so distinct encodings can
+    # run concurrently on separate threads.
+    unique_encodings = sorted({m.encoding for m in models})
+    # Resolve every encoding up front so invalid names fall back exactly once
+    # at startup and the counting path never pays the try/except.
+    resolved = {enc: _resolve_encoding(enc) for enc in unique_encodings}
+    if len(unique_encodings) > 1:
+        with ThreadPoolExecutor(max_workers=len(unique_encodings)) as executor:
+            token_cache = dict(zip(
+                unique_encodings,
+                executor.map(lambda enc: _count_with_encoder(resolved[enc], chunks), unique_encodings)
+            ))
+    else:
+        token_cache = {enc: _count_with_encoder(resolved[enc], chunks) for enc in unique_encodings}
+
+    headers = (
+        "Model", "Provider", "Tier", "Encoding", "Tokens",
+        "Input cost", "Output cost", "Total", "In /1M", "Out /1M"
+    )
+
+    # Build pre-sized tuple rows in header order and track column widths in
+    # the same pass; money formatting is inlined since attribute lookups and
+    # helper calls dominate this loop for long model lists.
+    widths = [len(h) for h in headers]
+    rows: List[Optional[tuple]] = [None] * len(models)
+    output_tokens = args.output_tokens
+    for row_idx, m in enumerate(models):
+        tokens = token_cache[m.encoding]
+        curr = m.pricing.currency
+        in_per_1m = m.pricing.input_per_1m
+        out_per_1m = m.pricing.output_per_1m
+        input_cost = (tokens / 1_000_000) * in_per_1m if in_per_1m is not None else None
+        output_cost = (output_tokens / 1_000_000) * out_per_1m if out_per_1m is not None else None
+        total = input_cost + output_cost if input_cost is not None and output_cost is not None else None
+        row = (
+            m.name,
+            m.provider,
+            m.tier,
+            m.encoding,
+            f"{tokens:,}",
+            "—" if input_cost is None else f"{input_cost:,.4f} {curr}",
+            "—" if output_cost is None else f"{output_cost:,.4f} {curr}",
+            "—" if total is None else f"{total:,.4f} {curr}",
+            "—" if in_per_1m is None else f"{in_per_1m:,.4f} {curr}",
+            "—" if out_per_1m is None else f"{out_per_1m:,.4f} {curr}",
+        )
+        for col, cell in enumerate(row):
+            if len(cell) > widths[col]:
+                widths[col] = len(cell)
+        rows[row_idx] = row
+
+    # One %-format template renders a whole row in a single C-level call
+    # instead of ten ljust calls per row.
+    row_format = " | ".join(f"%-{w}s" for w in widths)
+    print(f"\nInput: {args.input} ({total_chars:,} chars)")
+    print(f"Assumed output tokens: {args.output_tokens:,}\n")
+    print(row_format % headers)
+    print("-+-".join("-" * w for w in widths))
+    for row in rows:
+        print(row_format % row)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())